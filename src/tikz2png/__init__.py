@@ -1,7 +1,7 @@
 from .config import Config
 from .converter import TikZConverter, create_converter
 from .directories import Directories
-from .errors import ImageMagickError, LaTeXError
+from .errors import ImageConversionError, ImageMagickError, LaTeXError
 
 __version__ = "1.0.0"
 
@@ -11,5 +11,6 @@ __all__ = [
     "Directories",
     "Config",
     "LaTeXError",
+    "ImageConversionError",
     "ImageMagickError",
 ]
@@ -13,12 +13,17 @@ class Config:
         force: Flag to force regeneration of all PNGs (default: False)
         tikz_dir: Custom directory for TikZ source files (default: ./Assets/TikZ)
         output_dir: Custom directory for PNG outputs (default: ./Assets/figures)
+        jobs: Maximum number of files to convert concurrently (default: CPU count)
+        preamble: LaTeX file whose preamble is precompiled into a format file to
+            speed up compilation (default: None)
     """
 
     quiet: bool
     force: bool
     tikz_dir: Optional[Path]
     output_dir: Optional[Path]
+    jobs: Optional[int] = None
+    preamble: Optional[Path] = None
 
     @classmethod
     def from_args(cls, args: argparse.Namespace) -> "Config":
@@ -27,6 +32,8 @@ class Config:
             force=args.force,
             tikz_dir=args.tikz_dir,
             output_dir=args.output_dir,
+            jobs=args.jobs,
+            preamble=args.preamble,
         )
 
 
@@ -38,6 +45,25 @@ def validate_path(path: str) -> Path:
     return p
 
 
+def validate_file(path: str) -> Path:
+    """Validate that a path exists and is a regular file."""
+    p = validate_path(path)
+    if not p.is_file():
+        raise argparse.ArgumentTypeError(f"Not a file: {p}")
+    return p
+
+
+def positive_int(value: str) -> int:
+    """Validate that a value is a positive integer."""
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Not an integer: {value}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"Must be at least 1: {n}")
+    return n
+
+
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser for command-line options.
 
@@ -67,4 +93,15 @@ def create_argument_parser() -> argparse.ArgumentParser:
         type=validate_path,
         help="Custom directory for PNG outputs (default: ./Assets/figures)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        help="Number of files to convert in parallel (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--preamble",
+        type=validate_file,
+        help="LaTeX file whose shared preamble is precompiled to speed up builds",
+    )
     return parser
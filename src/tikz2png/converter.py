@@ -1,10 +1,18 @@
+import hashlib
+import json
 import logging
+import mmap
+import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
-from pathlib import Path
-from typing import List, Optional, Sequence
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 from rich.console import Console
 from rich.panel import Panel
@@ -13,7 +21,7 @@ from rich.text import Text
 
 from .config import Config, create_argument_parser
 from .directories import Directories
-from .errors import ImageMagickError, LaTeXError
+from .errors import ImageConversionError, ImageMagickError, LaTeXError
 from .interfaces import (
     FileManagerInterface,
     ImageConverterInterface,
@@ -24,6 +32,8 @@ __all__ = [
     "TikZConverter",
     "Directories",
     "ImageConverter",
+    "PdftocairoConverter",
+    "GhostscriptConverter",
     "LaTeXCompiler",
     "FileManager",
 ]
@@ -32,11 +42,31 @@ console = Console()
 logger = logging.getLogger("tikz2png")
 
 
-class ImageConverter(ImageConverterInterface):
-    """Handles conversion of PDF files to PNG format using ImageMagick."""
+def _worker_count(jobs: Optional[int]) -> int:
+    """Resolve the number of concurrent conversions, defaulting to the CPU count."""
+    return jobs or os.cpu_count() or 1
 
-    def __init__(self) -> None:
-        self.command: str = self._get_imagemagick_command()
+
+class ImageConverter:
+    """Handles conversion of PDF files to PNG format using ImageMagick.
+
+    Args:
+        threads: Cap on ImageMagick's internal worker threads per invocation,
+            applied only while other conversions are running at the same time.
+            Limiting each of several side-by-side conversions keeps the total
+            thread count near the number of cores instead of every process
+            spawning a thread per core; a conversion running alone keeps all
+            of them. ``None`` leaves the limit to ImageMagick.
+        command: Already-resolved ImageMagick executable; skips the PATH lookup
+    """
+
+    def __init__(
+        self, threads: Optional[int] = None, command: Optional[str] = None
+    ) -> None:
+        self.command: str = command or self._get_imagemagick_command()
+        self.threads = threads
+        self._active = 0
+        self._active_lock = threading.Lock()
 
     def _get_imagemagick_command(self) -> str:
         """Determine which ImageMagick command to utilise."""
@@ -57,10 +87,19 @@ class ImageConverter(ImageConverterInterface):
         raise ImageMagickError("ImageMagick not found. Please install ImageMagick.")
 
     def convert_pdf_to_png(self, pdf_file: Path, png_path: Path) -> None:
+        with self._active_lock:
+            self._active += 1
+            concurrent = self._active > 1
+        limits = (
+            ["-limit", "thread", str(self.threads)]
+            if self.threads and concurrent
+            else []
+        )
         try:
             subprocess.run(
                 [
                     self.command,
+                    *limits,
                     "-density",
                     "300",
                     str(pdf_file),
@@ -69,18 +108,275 @@ class ImageConverter(ImageConverterInterface):
                     str(png_path),
                 ],
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
             )
         except subprocess.CalledProcessError as err:
             raise ImageMagickError(f"Image conversion failed: {err.stderr}") from err
+        finally:
+            with self._active_lock:
+                self._active -= 1
+
+
+def _move_pages(render_dir: Path, png_path: Path) -> None:
+    """Move pages rendered as ``<prefix>-<n>.png`` (one-based) into place.
+
+    A single page is moved to ``png_path``; several are written next to it as
+    ``<stem>-<n>.png`` (zero-based), as ImageMagick names them.
+    """
+    pages = sorted(
+        render_dir.glob("*.png"), key=lambda page: int(page.stem.rsplit("-", 1)[1])
+    )
+    if len(pages) == 1:
+        os.replace(pages[0], png_path)
+        return
+    for index, page in enumerate(pages):
+        os.replace(page, png_path.with_name(f"{png_path.stem}-{index}.png"))
+
+
+class PdftocairoConverter:
+    """Handles conversion of PDF files to PNG format using Poppler's pdftocairo.
+
+    pdftocairo renders the PDF directly in a single process, avoiding
+    ImageMagick's hand-off to Ghostscript and its intermediate image.
+    Every page is rendered; multi-page PDFs produce ``<stem>-<n>.png``
+    (zero-based), as ImageMagick does.
+
+    Args:
+        command: Already-resolved pdftocairo executable; skips the PATH lookup
+    """
+
+    def __init__(self, command: Optional[str] = None) -> None:
+        self.command: str = command or self._get_pdftocairo_command()
+
+    def _get_pdftocairo_command(self) -> str:
+        """Determine the pdftocairo command for the current OS."""
+        cmd = "pdftocairo.exe" if platform.system() == "Windows" else "pdftocairo"
+        if shutil.which(cmd):
+            return cmd
+        raise ImageConversionError("pdftocairo not found. Please install Poppler.")
+
+    def convert_pdf_to_png(self, pdf_file: Path, png_path: Path) -> None:
+        with tempfile.TemporaryDirectory(dir=png_path.parent) as tmp:
+            try:
+                subprocess.run(
+                    [
+                        self.command,
+                        "-png",
+                        "-transp",
+                        "-r",
+                        "300",
+                        str(pdf_file),
+                        # Written as page-<n>.png, zero-padded to the page count
+                        str(Path(tmp) / "page"),
+                    ],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+            except subprocess.CalledProcessError as err:
+                raise ImageConversionError(
+                    f"Image conversion failed: {err.stderr}"
+                ) from err
+            _move_pages(Path(tmp), png_path)
+
+
+class GhostscriptConverter:
+    """Handles conversion of PDF files to PNG format by calling Ghostscript directly.
+
+    Ghostscript renders pages one after another, so with more than one worker
+    multi-page PDFs are split into contiguous page ranges that are rendered by
+    concurrent gs processes. A single worker renders every page in one gs call
+    without first probing the page count. Pages are written as
+    ``<stem>-<n>.png`` (zero-based), as ImageMagick does.
+
+    Args:
+        workers: Maximum number of gs processes per PDF (default: CPU count)
+        command: Already-resolved Ghostscript executable; skips the PATH lookup
+    """
+
+    def __init__(
+        self, workers: Optional[int] = None, command: Optional[str] = None
+    ) -> None:
+        self.command: str = command or self._get_ghostscript_command()
+        self.workers = workers or os.cpu_count() or 1
+
+    def _get_ghostscript_command(self) -> str:
+        """Determine the Ghostscript command for the current OS."""
+        if platform.system() == "Windows":
+            candidates = ["gswin64c.exe", "gswin32c.exe"]
+        else:
+            candidates = ["gs"]
+
+        for cmd in candidates:
+            if shutil.which(cmd):
+                return cmd
+        raise ImageConversionError("Ghostscript not found. Please install Ghostscript.")
+
+    def _run(self, args: List[str], capture_stdout: bool = False) -> str:
+        try:
+            return subprocess.run(
+                [self.command, "-q", *args],
+                check=True,
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            ).stdout
+        except subprocess.CalledProcessError as err:
+            raise ImageConversionError(
+                f"Image conversion failed: {err.stderr}"
+            ) from err
+
+    def page_count(self, pdf_file: Path) -> int:
+        """Return the number of pages in a PDF file."""
+        name = pdf_file.as_posix()
+        for char in "\\()":
+            name = name.replace(char, f"\\{char}")
+        output = self._run(
+            [
+                "-dNODISPLAY",
+                f"--permit-file-read={pdf_file}",
+                "-c",
+                f"({name}) (r) file runpdfbegin pdfpagecount = quit",
+            ],
+            capture_stdout=True,
+        )
+        try:
+            return int(output.split()[-1])
+        except (IndexError, ValueError):
+            raise ImageConversionError(
+                f"Could not read page count of {pdf_file.name}"
+            ) from None
+
+    def _render(
+        self,
+        pdf_file: Path,
+        output: Path,
+        first: Optional[int] = None,
+        last: Optional[int] = None,
+    ) -> None:
+        pages = [] if first is None else [f"-dFirstPage={first}", f"-dLastPage={last}"]
+        self._run(
+            [
+                "-dSAFER",
+                "-sDEVICE=pngalpha",
+                "-r300",
+                "-dTextAlphaBits=4",
+                "-dGraphicsAlphaBits=4",
+                *pages,
+                "-o",
+                str(output),
+                str(pdf_file),
+            ]
+        )
+
+    def convert_pdf_to_png(self, pdf_file: Path, png_path: Path) -> None:
+        if self.workers == 1:
+            # Nothing to split across, so skip the page count probe
+            with tempfile.TemporaryDirectory(dir=png_path.parent) as tmp:
+                self._render(pdf_file, Path(tmp) / "page-%d.png")
+                _move_pages(Path(tmp), png_path)
+            return
+
+        pages = self.page_count(pdf_file)
+        if pages <= 1:
+            self._render(pdf_file, png_path, 1, 1)
+            return
+
+        chunks = min(self.workers, pages)
+        bounds = [1 + pages * i // chunks for i in range(chunks + 1)]
+        ranges = [(bounds[i], bounds[i + 1] - 1) for i in range(chunks)]
+
+        with tempfile.TemporaryDirectory(dir=png_path.parent) as tmp:
+            tmp_dir = Path(tmp)
+            with ThreadPoolExecutor(max_workers=chunks) as executor:
+                futures = [
+                    executor.submit(
+                        self._render,
+                        pdf_file,
+                        tmp_dir / f"{first}-%d.png",
+                        first,
+                        last,
+                    )
+                    for first, last in ranges
+                ]
+                for future in futures:
+                    future.result()
+
+            # gs numbers each range's output from 1; renumber by absolute page
+            for first, last in ranges:
+                for page in range(first, last + 1):
+                    os.replace(
+                        tmp_dir / f"{first}-{page - first + 1}.png",
+                        png_path.with_name(f"{png_path.stem}-{page - 1}.png"),
+                    )
+
+
+def create_image_converter(threads: Optional[int] = None) -> ImageConverterInterface:
+    """Create the fastest available PDF to PNG converter.
+
+    Prefers pdftocairo, then Ghostscript, and falls back to ImageMagick.
+
+    Args:
+        threads: Number of threads (ImageMagick) or processes (Ghostscript)
+            a single conversion may use
+
+    Returns:
+        ImageConverterInterface: The selected converter
+
+    Raises:
+        ImageConversionError: If none of the converters is installed
+    """
+    try:
+        return PdftocairoConverter()
+    except ImageConversionError:
+        pass
+    try:
+        return GhostscriptConverter(workers=threads)
+    except ImageConversionError:
+        pass
+    try:
+        return ImageConverter(threads=threads)
+    except ImageMagickError:
+        raise ImageConversionError(
+            "No PDF to PNG converter found. "
+            "Please install Poppler, Ghostscript or ImageMagick."
+        ) from None
+
 
+def _default_cache_dir() -> Path:
+    """Return the per-user cache directory for tikz2png."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "tikz2png"
 
-class LaTeXCompiler(LaTeXCompilerInterface):
-    """Handles compilation of LaTeX files to PDF format."""
 
-    def __init__(self) -> None:
-        self.latex_command = self._get_latex_command()
+class LaTeXCompiler:
+    """Handles compilation of LaTeX files to PDF format.
+
+    Args:
+        preamble: Optional LaTeX file whose preamble is precompiled into a
+            format file with ``mylatexformat``. Documents are then compiled
+            against that format, skipping their own preamble up to
+            ``\\begin{document}`` (or ``\\endofdump``), so they should share
+            the dumped preamble.
+        cache_dir: Directory for generated format files
+            (default: ~/.cache/tikz2png)
+        command: Already-resolved LaTeX executable; skips the PATH lookup
+    """
+
+    def __init__(
+        self,
+        preamble: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        command: Optional[str] = None,
+    ) -> None:
+        self.latex_command = command or self._get_latex_command()
+        self.format_dir = cache_dir or _default_cache_dir()
+        self.format_name: Optional[str] = (
+            self._build_format(preamble) if preamble else None
+        )
 
     def _get_latex_command(self) -> str:
         """Get the appropriate LaTeX command for current OS."""
@@ -94,6 +390,77 @@ class LaTeXCompiler(LaTeXCompilerInterface):
                 return cmd
         raise LaTeXError("LaTeX compiler not found. Please install LaTeX.")
 
+    def _engine_version(self) -> str:
+        """Return the first line of the LaTeX engine's version banner."""
+        try:
+            result = subprocess.run(
+                [self.latex_command, "--version"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True,
+                text=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+        return result.stdout.partition("\n")[0]
+
+    def _build_format(self, preamble: Path) -> str:
+        """Dump the preamble into a format file, reusing a cached one if present.
+
+        The format is named after a hash of the engine, its version and the
+        preamble together with the local files it pulls in, so upgrading TeX or
+        editing the preamble produces a new format instead of reusing a stale
+        one. It is built in a temporary directory and only moved into the cache
+        once the dump succeeds.
+
+        Returns:
+            str: Name of the format, as passed to ``-fmt``
+        """
+        if not preamble.exists():
+            raise FileNotFoundError(f"Preamble file not found: {preamble}")
+
+        engine = Path(self.latex_command).stem
+        key = "\n".join([engine, self._engine_version(), hash_tex(preamble)])
+        digest = hashlib.blake2b(key.encode(), digest_size=6).hexdigest()
+        name = f"tikz2png-{digest}"
+        format_file = self.format_dir / f"{name}.fmt"
+        if format_file.exists():
+            return name
+
+        self.format_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.format_dir) as work:
+            try:
+                subprocess.run(
+                    [
+                        self.latex_command,
+                        "-ini",
+                        f"-jobname={name}",
+                        f"-output-directory={work}",
+                        "-interaction=nonstopmode",
+                        f"&{engine} mylatexformat.ltx {preamble.name}",
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    check=True,
+                    cwd=preamble.parent,
+                )
+            except subprocess.CalledProcessError as err:
+                # nonstopmode still dumps a format after most errors; it is
+                # discarded with the directory rather than cached
+                log_file = Path(work) / f"{name}.log"
+                errors = extract_log_errors(log_file) or extract_latex_errors(
+                    err.stderr
+                )
+                raise LaTeXError(f"Building preamble format failed: {errors}") from err
+
+            try:
+                os.replace(Path(work) / format_file.name, format_file)
+            except FileNotFoundError:
+                raise LaTeXError(
+                    f"Building preamble format produced no {format_file.name}"
+                ) from None
+        return name
+
     def compile(self, tex_file: Path) -> None:
         """
         Compile LaTeX file to PDF.
@@ -111,71 +478,373 @@ class LaTeXCompiler(LaTeXCompilerInterface):
         working_dir = tex_file.parent
         tex_filename = tex_file.name
 
+        env = None
+        if self.format_name:
+            # The trailing separator keeps the distribution's own format path
+            env = {**os.environ, "TEXFORMATS": f"{self.format_dir}{os.pathsep}"}
+
+        # Each compilation writes its .aux/.log/.pdf into a private directory so
+        # concurrent jobs never share auxiliary files; only the PDF is kept.
+        with tempfile.TemporaryDirectory(prefix="tikz2png-") as work:
+            # \include writes its .aux under the output directory, which
+            # pdflatex expects to already contain the included file's folder
+            for subdir in _include_dirs(tex_file):
+                (Path(work) / subdir).mkdir(parents=True, exist_ok=True)
+
+            args = [
+                self.latex_command,
+                "-interaction=nonstopmode",
+                f"-output-directory={work}",
+                tex_filename,
+            ]
+            if self.format_name:
+                args.insert(1, f"-fmt={self.format_name}")
+
+            try:
+                # pdflatex's console chatter is never used, so it is not buffered;
+                # stderr stays undecoded and is only read when the run fails
+                subprocess.run(
+                    args,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    check=True,
+                    cwd=working_dir,
+                    env=env,
+                )
+            except subprocess.CalledProcessError as err:
+                # pdflatex reports errors in its log rather than on stderr
+                log_file = Path(work) / f"{tex_file.stem}.log"
+                errors = extract_log_errors(log_file) or extract_latex_errors(
+                    err.stderr
+                )
+                raise LaTeXError(f"LaTeX compilation failed: {errors}") from err
+
+            pdf_file = Path(work) / f"{tex_file.stem}.pdf"
+            if not pdf_file.exists():
+                raise LaTeXError(
+                    f"LaTeX compilation produced no PDF for {tex_filename}"
+                )
+            shutil.move(str(pdf_file), str(working_dir / pdf_file.name))
+
+
+MANIFEST_NAME = ".tikz2png-manifest.jsonl"
+
+
+def _load_manifest(manifest: Path) -> Dict[str, Tuple[str, Tuple[str, ...]]]:
+    """Read a hash manifest, keeping the latest record for each stem.
+
+    Returns:
+        Dict[str, Tuple[str, Tuple[str, ...]]]: Source hash and dependency
+        names (relative to the TeX directory) keyed by stem
+    """
+    try:
+        lines = manifest.read_bytes().splitlines()
+    except FileNotFoundError:
+        return {}
+
+    records: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+    for line in lines:
         try:
-            subprocess.run(
-                [self.latex_command, "-interaction=nonstopmode", tex_filename],
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=working_dir,
+            entry = json.loads(line)
+            records[entry["stem"]] = (entry["hash"], tuple(entry.get("deps", ())))
+        except (ValueError, KeyError, TypeError):
+            continue  # e.g. a line cut short by an interrupted run
+
+    # Entries are appended on every conversion; drop superseded ones
+    if len(lines) > len(records):
+        manifest.write_text(
+            "".join(
+                _manifest_line(stem, digest, deps)
+                for stem, (digest, deps) in records.items()
             )
-        except subprocess.CalledProcessError as err:
-            raise LaTeXError(
-                f"LaTeX compilation failed: {extract_latex_errors(err.stderr)}"
-            ) from err
+        )
+    return records
+
 
+def _manifest_line(stem: str, digest: str, deps: Sequence[str]) -> str:
+    """Format one manifest record as a JSON line."""
+    return json.dumps({"stem": stem, "hash": digest, "deps": list(deps)}) + "\n"
 
-class FileManager(FileManagerInterface):
-    """Handles file operations and status checks."""
 
-    def __init__(self, console: Optional[Console] = None) -> None:
-        """Initialise FileManager with a console for output."""
+def _dependency_name(dep: Path, base: Path) -> str:
+    """Name a dependency relative to the TeX directory, as stored in the manifest.
+
+    Dependencies outside the directory keep a ``..`` prefix; ones that have no
+    relative path at all (e.g. on another drive) are stored absolute.
+    """
+    try:
+        return Path(os.path.relpath(dep, base)).as_posix()
+    except ValueError:
+        return dep.absolute().as_posix()
+
+
+def _discard(*args: object, **kwargs: object) -> None:
+    """Swallow a console message."""
+
+
+class FileManager:
+    """Handles file operations and status checks.
+
+    Source hashes of generated PNGs, together with the local files each
+    source pulls in, are kept in memory and, when a manifest path is given,
+    persisted as JSON lines (``{"stem": ..., "hash": ..., "deps": [...]}``)
+    so later runs can tell touched-but-unchanged sources from edited ones.
+    """
+
+    def __init__(
+        self, console: Optional[Console] = None, manifest: Optional[Path] = None
+    ) -> None:
+        """Initialise FileManager with a console for output and optional manifest."""
         self.console = console or Console()
+        # Per-file status lines are only worth rendering for an interactive
+        # terminal; when output is piped they are dropped without touching Rich
+        self._print = self.console.print if self.console.is_terminal else _discard
+        self.manifest = manifest
+        self._manifest_lock = threading.Lock()
+        self._records: Dict[str, Tuple[str, Tuple[str, ...]]] = (
+            _load_manifest(manifest) if manifest else {}
+        )
+
+    def needs_update(
+        self,
+        tex_file: Path,
+        png_file: Path,
+        mtimes: Optional[Mapping[str, float]] = None,
+    ) -> bool:
+        """Check if PNG needs to be regenerated based on file timestamps.
+
+        The source counts as modified when the TeX file or any local file it
+        was recorded to include is newer than the PNG. Modified sources whose
+        hash still matches the manifest are skipped, and the PNG's timestamp
+        is bumped so later runs skip them without hashing again.
 
-    def needs_update(self, tex_file: Path, png_file: Path) -> bool:
-        """Check if PNG needs to be regenerated based on file timestamps."""
-        if not png_file.exists():
-            self.console.print(f"🆕 [cyan]Will generate:[/] {png_file.name}")
+        When ``mtimes`` (as built by :func:`scan_mtimes`) is given, timestamps
+        are looked up by file name instead of calling ``stat``.
+        """
+        if mtimes is not None:
+            png_mtime = mtimes.get(png_file.name)
+        else:
+            try:
+                png_mtime = png_file.stat().st_mtime
+            except FileNotFoundError:
+                png_mtime = None
+        if png_mtime is None:
+            self._print(f"🆕 [cyan]Will generate:[/] {png_file.name}")
             return True
-        is_newer = tex_file.stat().st_mtime > png_file.stat().st_mtime
+        if mtimes is not None:
+            tex_mtime = mtimes[tex_file.name]
+        else:
+            tex_mtime = tex_file.stat().st_mtime
+        source_mtime = max(tex_mtime, self._dependency_mtime(tex_file, png_file))
+        is_newer = source_mtime > png_mtime
+        # A newer timestamp alone (e.g. after a git checkout) is not enough
+        if is_newer and self._source_unchanged(tex_file, png_file):
+            try:
+                os.utime(png_file)
+            except OSError:
+                pass
+            is_newer = False
         if not is_newer:
-            self.console.print(
+            self._print(
                 f"\n⏭️  [yellow]Skipping:[/] {tex_file.name} (PNG is up to date)"
             )
         return is_newer
 
-    def cleanup_auxiliary_files(self, base_path: Path) -> None:
-        """Clean up auxiliary files using the full path."""
-        working_dir = base_path.parent
-        base_name = base_path.stem
-        for ext in [".aux", ".log", ".pdf", ".pdb_latexmk", ".fls"]:
-            aux_file = working_dir / f"{base_name}{ext}"
+    def _dependency_mtime(self, tex_file: Path, png_file: Path) -> float:
+        """Return the newest modification time of the files recorded for a PNG."""
+        record = self._records.get(png_file.stem)
+        newest = 0.0
+        for name in record[1] if record else ():
             try:
-                if aux_file.exists():
-                    aux_file.unlink()
-                    self.console.print(
-                        f"\n🗑️  [dim]Removed auxiliary file:[/] {aux_file.name}"
-                    )
-            except Exception as err:
-                self.console.print(
-                    f"\n⚠️  [yellow]Failed to remove[/] {aux_file.name}: {str(err)}"
-                )
+                newest = max(newest, (tex_file.parent / name).stat().st_mtime)
+            except OSError:
+                return float("inf")  # a removed dependency forces a rehash
+        return newest
+
+    def _source_unchanged(self, tex_file: Path, png_file: Path) -> bool:
+        """Check whether the TeX source still matches the hash recorded for a PNG."""
+        record = self._records.get(png_file.stem)
+        if record is None:
+            return False
+        try:
+            return record[0] == hash_tex(tex_file)
+        except OSError:
+            return False
+
+    def mark_updated(self, tex_file: Path, png_file: Path) -> None:
+        """Record the hash and dependencies of the TeX source a PNG came from.
+
+        Failing to record them only costs a rebuild on the next run, so errors
+        are logged rather than raised.
+        """
+        try:
+            digest, deps = scan_tex(tex_file)
+            names = tuple(_dependency_name(dep, tex_file.parent) for dep in deps)
+        except (OSError, ValueError) as err:
+            logger.warning(f"Could not record source hash of {tex_file.name}: {err}")
+            return
+        line = _manifest_line(png_file.stem, digest, names)
+        with self._manifest_lock:
+            self._records[png_file.stem] = (digest, names)
+            if self.manifest:
+                try:
+                    with self.manifest.open("a") as f:
+                        f.write(line)
+                except OSError as err:
+                    logger.warning(f"Could not update {self.manifest.name}: {err}")
+
+    def cleanup_auxiliary_files(self, base_path: Path) -> None:
+        """Remove the intermediate PDF moved next to the TeX source.
+
+        LaTeX's other auxiliary files stay in its private build directory, so
+        any ``.aux`` or ``.log`` next to the source belongs to the user.
+        """
+        pdf_file = base_path.with_suffix(".pdf")
+        try:
+            # Unlink directly rather than checking existence first
+            pdf_file.unlink()
+        except FileNotFoundError:
+            return
+        except Exception as err:
+            self.console.print(
+                f"\n⚠️  [yellow]Failed to remove[/] {pdf_file.name}: {str(err)}"
+            )
+            return
+        self._print(f"\n🗑️  [dim]Removed auxiliary file:[/] {pdf_file.name}")
+
+
+def scan_mtimes(directory: Path, suffix: str) -> Dict[str, float]:
+    """Collect modification times of the files in a directory with a given suffix.
+
+    Args:
+        directory: Directory to scan (not recursively)
+        suffix: File suffix to match, e.g. ".tex"
+
+    Returns:
+        Dict[str, float]: Modification times keyed by file name
+    """
+    with os.scandir(directory) as entries:
+        return {
+            entry.name: entry.stat().st_mtime
+            for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        }
+
+
+_INPUT_RE = re.compile(rb"\\(?:input|include)\s*\{([^}]+)\}")
+
+
+_INCLUDE_RE = re.compile(rb"\\include\s*\{([^}]+)\}")
+
+
+def _include_dirs(tex_file: Path) -> List[PurePosixPath]:
+    """Find the subdirectories named by a TeX file's ``\\include`` commands.
+
+    Absolute paths and paths leaving the source directory are skipped, as they
+    cannot be mirrored inside LaTeX's output directory.
+    """
+    dirs: List[PurePosixPath] = []
+    for match in _INCLUDE_RE.findall(tex_file.read_bytes()):
+        parent = PurePosixPath(match.decode(errors="replace").strip()).parent
+        if parent.parts and not parent.is_absolute() and ".." not in parent.parts:
+            dirs.append(parent)
+    return dirs
+
+
+def scan_tex(tex_file: Path) -> Tuple[str, List[Path]]:
+    """Hash a TeX file together with the local files it pulls in.
+
+    Files referenced through ``\\input`` or ``\\include`` are resolved relative
+    to the directory LaTeX is run from and folded into the hash, so editing an
+    included file changes it. References that cannot be found locally
+    (e.g. files from the TeX distribution) are ignored.
+
+    Args:
+        tex_file: Path to the TeX file to hash
+
+    Returns:
+        Tuple[str, List[Path]]: Hex digest of the file and its local
+        dependencies, and the dependencies found
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    pending = [tex_file]
+    seen = {tex_file}
+    deps: List[Path] = []
+    while pending:
+        data = pending.pop().read_bytes()
+        digest.update(data)
+        for match in _INPUT_RE.findall(data):
+            name = match.decode(errors="replace").strip()
+            for dep in (tex_file.parent / f"{name}.tex", tex_file.parent / name):
+                if dep.is_file():
+                    if dep not in seen:
+                        seen.add(dep)
+                        deps.append(dep)
+                        pending.append(dep)
+                    break
+    return digest.hexdigest(), deps
+
+
+def hash_tex(tex_file: Path) -> str:
+    """Hash a TeX file together with the local files it pulls in.
 
+    See :func:`scan_tex`.
 
-def extract_latex_errors(stderr: str) -> str:
+    Args:
+        tex_file: Path to the TeX file to hash
+
+    Returns:
+        str: Hex digest of the file and its local dependencies
+    """
+    return scan_tex(tex_file)[0]
+
+
+_LATEX_ERROR_RE = re.compile(rb"^.*(?:error|fatal|!).*$", re.IGNORECASE | re.MULTILINE)
+
+
+def extract_latex_errors(stderr: Union[str, bytes]) -> str:
     """Extract relevant error messages from LaTeX output.
 
     Args:
-        stderr: The standard error output from LaTeX compilation
+        stderr: The standard error output from LaTeX compilation, either
+            decoded or as raw bytes
 
     Returns:
         str: Formatted error messages or the original stderr if no specific errors found
     """
-    error_lines: List[str] = []
-    for line in stderr.splitlines():
-        if any(x in line.lower() for x in ["error", "!", "fatal"]):
-            error_lines.append(line.strip())
-    return "\n".join(error_lines) if error_lines else stderr
+    raw = stderr.encode() if isinstance(stderr, str) else stderr
+    error_lines = _LATEX_ERROR_RE.findall(raw)
+    if error_lines:
+        return _join_error_lines(error_lines)
+    return stderr if isinstance(stderr, str) else stderr.decode(errors="replace")
+
+
+def extract_log_errors(log_file: Path) -> Optional[str]:
+    """Extract error messages from a LaTeX log file.
+
+    The log is memory-mapped and scanned in place, so only the matching
+    lines are ever copied, however large the log grows.
+
+    Args:
+        log_file: Path to the .log file written by LaTeX
+
+    Returns:
+        Optional[str]: Formatted error messages, or None if the log is
+            missing, empty or contains no errors
+    """
+    try:
+        with (
+            log_file.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log,
+        ):
+            error_lines = _LATEX_ERROR_RE.findall(log)
+    except (FileNotFoundError, ValueError):  # empty files cannot be mapped
+        return None
+    return _join_error_lines(error_lines) if error_lines else None
+
+
+def _join_error_lines(error_lines: List[bytes]) -> str:
+    return b"\n".join(line.strip() for line in error_lines).decode(errors="replace")
 
 
 class TikZConverter:
@@ -189,6 +858,7 @@ class TikZConverter:
         image_converter: Component for PDF to PNG conversion
         latex_compiler: Component for LaTeX compilation
         file_manager: Component for file operations
+        jobs: Maximum number of files converted concurrently (default: CPU count)
         stats: Dictionary tracking conversion statistics
     """
 
@@ -198,12 +868,20 @@ class TikZConverter:
         image_converter: ImageConverterInterface,
         latex_compiler: LaTeXCompilerInterface,
         file_manager: FileManagerInterface,
+        jobs: Optional[int] = None,
     ) -> None:
         self.directories = directories
         self.image_converter = image_converter
         self.latex_compiler = latex_compiler
         self.file_manager = file_manager
+        self.jobs = jobs
         self.stats = {"processed": 0, "skipped": 0, "failed": 0}
+        self._stats_lock = threading.Lock()
+
+    def _record(self, outcome: str) -> None:
+        """Increment a statistics counter; safe to call from worker threads."""
+        with self._stats_lock:
+            self.stats[outcome] += 1
 
     def process_file(
         self,
@@ -214,7 +892,7 @@ class TikZConverter:
     ) -> bool:
         png_path: Path = self.directories.figures / f"{tex_file.stem}.png"
         if not force and not self.file_manager.needs_update(tex_file, png_path):
-            self.stats["skipped"] += 1
+            self._record("skipped")
             return False
 
         try:
@@ -224,18 +902,20 @@ class TikZConverter:
             self.latex_compiler.compile(tex_file)
             pdf_file = (tex_file.parent / f"{tex_file.stem}.pdf").absolute()
             self.image_converter.convert_pdf_to_png(pdf_file, png_path)
+            self.file_manager.mark_updated(tex_file, png_path)
 
-            if progress:
+            # Like FileManager's status lines, only worth a redraw on a terminal
+            if progress and progress.console.is_terminal:
                 progress.console.print(
                     f"\n✅ [green]Successfully converted:[/] {tex_file.name} "
                     f"-> {png_path.name}"
                 )
 
             self.file_manager.cleanup_auxiliary_files(tex_file.absolute())
-            self.stats["processed"] += 1
+            self._record("processed")
             return True
         except Exception as e:
-            self.stats["failed"] += 1
+            self._record("failed")
             if progress:
                 progress.console.print(
                     f"[red]Error processing {tex_file.name}: {str(e)}[/]"
@@ -243,10 +923,22 @@ class TikZConverter:
             return False
 
     def run(self, force: bool = False) -> None:
-        tex_files: Sequence[Path] = list(self.directories.tikz.glob("*.tex"))
+        """Convert every TikZ file, running up to ``jobs`` files concurrently.
+
+        Each file is compiled and rasterised by external processes, so worker
+        threads spend their time waiting on subprocesses rather than holding
+        the GIL. Up-to-date files are settled on the calling thread from the
+        scanned timestamps and never reach the pool; progress and logging are
+        also handled there.
+        """
+        # One directory scan per side replaces exists/stat calls for every file
+        mtimes = scan_mtimes(self.directories.tikz, ".tex")
+        tex_files: Sequence[Path] = [self.directories.tikz / name for name in mtimes]
         if not tex_files:
             logger.warning("No .tex files found in Assets/TikZ!")
             return
+        if not force:
+            mtimes.update(scan_mtimes(self.directories.figures, ".png"))
 
         console.print(
             Panel(
@@ -265,11 +957,39 @@ class TikZConverter:
             transient=True,
         ) as progress:
             task = progress.add_task("Processing files...", total=len(tex_files))
+            workers = min(_worker_count(self.jobs), len(tex_files))
+
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                # Resolve the per-file lookups once rather than on every iteration
+                figures_dir = self.directories.figures
+                needs_update = self.file_manager.needs_update
+                process_file = self.process_file
+                record = self._record
+                advance = progress.advance
+                submit = executor.submit
 
-            for tex_file in tex_files:
-                if self.process_file(tex_file, force, task, progress):
-                    logger.info(f"✅ [green]Processed:[/] {tex_file.name}")
-                progress.advance(task)
+                futures = {}
+                for tex_file in tex_files:
+                    png_path = figures_dir / f"{tex_file.stem}.png"
+                    if not force and not needs_update(tex_file, png_path, mtimes):
+                        record("skipped")
+                        advance(task)
+                        continue
+                    # Staleness is already decided, so the worker must not recheck
+                    future = submit(process_file, tex_file, True, task, progress)
+                    futures[future] = tex_file
+
+                for future in as_completed(futures):
+                    if future.result():
+                        logger.info(f"✅ [green]Processed:[/] {futures[future].name}")
+                    advance(task)
+            except BaseException:
+                # Drop queued files on Ctrl-C or errors instead of compiling
+                # them all while the pool shuts down
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
 
         summary = Text()
         summary.append("\n📊 Summary:\n", style="bold")
@@ -294,11 +1014,20 @@ def create_converter(config: "Config") -> "TikZConverter":
     )
     directories.validate()
 
+    # Share the cores between concurrent ImageMagick processes
+    threads = max(1, (os.cpu_count() or 1) // _worker_count(config.jobs))
+
+    manifest = directories.figures / MANIFEST_NAME
+    if config.force:
+        # Every PNG is regenerated, so recorded hashes are all superseded
+        manifest.unlink(missing_ok=True)
+
     return TikZConverter(
         directories=directories,
-        image_converter=ImageConverter(),
-        latex_compiler=LaTeXCompiler(),
-        file_manager=FileManager(console=console),
+        image_converter=create_image_converter(threads=threads),
+        latex_compiler=LaTeXCompiler(preamble=config.preamble),
+        file_manager=FileManager(console=console, manifest=manifest),
+        jobs=config.jobs,
     )
 
 
@@ -1,4 +1,14 @@
-class ImageMagickError(Exception):
+class ImageConversionError(Exception):
+    """Raised when converting a PDF to PNG fails.
+
+    This is the base class for errors raised by any image conversion backend,
+    such as a missing converter executable or a failed conversion.
+    """
+
+    pass
+
+
+class ImageMagickError(ImageConversionError):
     """Raised when ImageMagick operations fail.
 
     This exception is raised when there are issues with image conversion,
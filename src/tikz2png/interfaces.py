@@ -1,11 +1,10 @@
-from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Mapping, Optional, Protocol
 
 
-class ImageConverterInterface(ABC):
+class ImageConverterInterface(Protocol):
     """Interface for converting PDF files to PNG format."""
 
-    @abstractmethod
     def convert_pdf_to_png(
         self, pdf_file: Path, png_path: Path
     ) -> None:  # pragma: no cover
@@ -15,43 +14,56 @@ class ImageConverterInterface(ABC):
             pdf_file: Path to the source PDF file
             png_path: Path where the PNG should be saved
         """
-        pass
+        ...
 
 
-class LaTeXCompilerInterface(ABC):
+class LaTeXCompilerInterface(Protocol):
     """Interface for compiling LaTeX documents."""
 
-    @abstractmethod
     def compile(self, tex_file: Path) -> None:  # pragma: no cover
         """Compile a LaTeX file to PDF.
 
         Args:
             tex_file: Path to the LaTeX file to compile
         """
-        pass
+        ...
 
 
-class FileManagerInterface(ABC):
+class FileManagerInterface(Protocol):
     """Interface for managing file operations during conversion."""
 
-    @abstractmethod
-    def needs_update(self, tex_file: Path, png_file: Path) -> bool:  # pragma: no cover
+    def needs_update(
+        self,
+        tex_file: Path,
+        png_file: Path,
+        mtimes: Optional[Mapping[str, float]] = None,
+    ) -> bool:  # pragma: no cover
         """Check if PNG needs to be regenerated based on file timestamps.
 
         Args:
             tex_file: Path to the source TeX file
             png_file: Path to the target PNG file
+            mtimes: Optional modification times keyed by file name, used in
+                place of stat calls when provided
 
         Returns:
             bool: True if PNG needs updating, False otherwise
         """
-        pass
+        ...
+
+    def mark_updated(self, tex_file: Path, png_file: Path) -> None:  # pragma: no cover
+        """Record that a PNG was regenerated from the current TeX source.
+
+        Args:
+            tex_file: Path to the source TeX file
+            png_file: Path to the generated PNG file
+        """
+        ...
 
-    @abstractmethod
     def cleanup_auxiliary_files(self, base_path: Path) -> None:  # pragma: no cover
         """Clean up auxiliary files generated during conversion.
 
         Args:
             base_path: Base path where auxiliary files are located
         """
-        pass
+        ...
@@ -1,16 +1,80 @@
+import functools
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Generator
+from unittest.mock import Mock, create_autospec
 
 import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
 
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
+from tikz2png.converter import ImageConverter, LaTeXCompiler  # noqa: E402
+from tikz2png.interfaces import (  # noqa: E402
+    FileManagerInterface,
+    ImageConverterInterface,
+    LaTeXCompilerInterface,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_subprocess(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Make subprocess.run fail unless the test is marked ``real_subprocess``."""
+    if "real_subprocess" in request.keywords:
+        return
+    error = subprocess.CalledProcessError(1, [], stderr=b"mocked")
+    monkeypatch.setattr(subprocess, "run", Mock(side_effect=error))
+
 
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for tests."""
     with tempfile.TemporaryDirectory() as tmp:
         yield Path(tmp)
+
+
+@pytest.fixture
+def fake_dir(fs: FakeFilesystem) -> Path:
+    """Provide an empty directory on pyfakefs's in-memory filesystem."""
+    return Path(fs.create_dir("/work").path)
+
+
+@pytest.fixture(scope="session")
+def image_converter() -> ImageConverter:
+    """Share one default ImageConverter; the command is injected, not looked up."""
+    return ImageConverter(command="magick")
+
+
+@pytest.fixture(scope="session")
+def latex_compiler() -> LaTeXCompiler:
+    """Share one default LaTeXCompiler; the command is injected, not looked up."""
+    return LaTeXCompiler(command="pdflatex")
+
+
+@functools.lru_cache(maxsize=None)
+def _spec(cls: type) -> Mock:
+    """Build the autospec for an interface once per session."""
+    return create_autospec(cls)
+
+
+def _fresh_spec(cls: type) -> Mock:
+    """Return the cached autospec with calls and configured results cleared."""
+    mock = _spec(cls)
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+@pytest.fixture
+def mocks() -> SimpleNamespace:
+    """Provide reset autospec mocks for the TikZConverter collaborators."""
+    return SimpleNamespace(
+        image_converter=_fresh_spec(ImageConverterInterface),
+        latex_compiler=_fresh_spec(LaTeXCompilerInterface),
+        file_manager=_fresh_spec(FileManagerInterface),
+    )
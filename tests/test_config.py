@@ -9,8 +9,10 @@ def test_config_from_args(temp_dir: Path) -> None:
     """Test config creation from command line arguments."""
     tikz_dir = temp_dir / "tikz"
     figures_dir = temp_dir / "figures"
+    preamble = tikz_dir / "preamble.tex"
     tikz_dir.mkdir()
     figures_dir.mkdir()
+    preamble.write_text("\\documentclass{standalone}")
 
     parser = create_argument_parser()
     args = parser.parse_args(
@@ -21,6 +23,10 @@ def test_config_from_args(temp_dir: Path) -> None:
             str(tikz_dir),
             "--output-dir",
             str(figures_dir),
+            "--jobs",
+            "4",
+            "--preamble",
+            str(preamble),
         ]
     )
     config = Config.from_args(args)
@@ -29,6 +35,8 @@ def test_config_from_args(temp_dir: Path) -> None:
     assert config.force is True
     assert config.tikz_dir == tikz_dir
     assert config.output_dir == figures_dir
+    assert config.jobs == 4
+    assert config.preamble == preamble
 
 
 def test_config_with_missing_args() -> None:
@@ -40,9 +48,24 @@ def test_config_with_missing_args() -> None:
     assert config.force is False
     assert config.tikz_dir is None
     assert config.output_dir is None
+    assert config.jobs is None
+    assert config.preamble is None
 
 
 def test_config_with_invalid_paths() -> None:
     parser = create_argument_parser()
     with pytest.raises(SystemExit):
         parser.parse_args(["--tikz-dir", "/nonexistent/path"])
+
+
+def test_config_with_directory_preamble(temp_dir: Path) -> None:
+    parser = create_argument_parser()
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--preamble", str(temp_dir)])
+
+
+def test_config_with_invalid_jobs() -> None:
+    parser = create_argument_parser()
+    for value in ["0", "-2", "many"]:
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--jobs", value])
@@ -1,15 +1,21 @@
+import argparse
 import logging
+import os
 import subprocess
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Any, Optional
-from unittest.mock import Mock, call, create_autospec, patch
+from types import SimpleNamespace
+from typing import Callable, Dict, Generator, Optional, Sequence, Union
+from unittest.mock import Mock, patch
 
 import pytest
 from rich.progress import TaskID
 
 from tikz2png.config import Config
 from tikz2png.converter import (
+    MANIFEST_NAME,
     FileManager,
     ImageConverter,
     ImageMagickError,
@@ -20,16 +26,8 @@ from tikz2png.converter import (
     extract_latex_errors,
     main,
 )
-from tikz2png.interfaces import (
-    FileManagerInterface,
-    ImageConverterInterface,
-    LaTeXCompilerInterface,
-)
-
 
-def test_extract_latex_errors_with_error() -> None:
-    """Test that LaTeX errors are properly extracted."""
-    stderr = """
+STDERR_WITH_ERROR = """
     ! LaTeX Error: File `nonexistent.sty' not found
 
     Other output that should be ignored
@@ -37,18 +35,30 @@ def test_extract_latex_errors_with_error() -> None:
 
     More text to ignore
     """
-    result = extract_latex_errors(stderr)
-    assert "LaTeX Error: File `nonexistent.sty' not found" in result
-    assert "Fatal error occurred" in result
-    assert "Other output that should be ignored" not in result
-    assert "More text to ignore" not in result
+STDERR_WITHOUT_ERROR = "Normal LaTeX output without any errors"
 
 
-def test_extract_latex_errors_without_error() -> None:
-    """Test that non-error output is returned as-is."""
-    stderr = "Normal LaTeX output without any errors"
-    result = extract_latex_errors(stderr)
-    assert result == stderr
+@pytest.mark.parametrize(
+    "stderr, expected",
+    [
+        # Only error lines are kept
+        (
+            STDERR_WITH_ERROR,
+            "! LaTeX Error: File `nonexistent.sty' not found\n! Fatal error occurred",
+        ),
+        # Non-error output is returned as-is
+        (STDERR_WITHOUT_ERROR, STDERR_WITHOUT_ERROR),
+        # Raw subprocess output is scanned without decoding it first
+        (
+            b"This is pdfTeX\r\n! Undefined control sequence.\r\nl.3 \\error\r\n",
+            "! Undefined control sequence.\nl.3 \\error",
+        ),
+        (b"no problems here", "no problems here"),
+    ],
+)
+def test_extract_latex_errors(stderr: Union[str, bytes], expected: str) -> None:
+    """Test that relevant LaTeX error lines are extracted."""
+    assert extract_latex_errors(stderr) == expected
 
 
 def test_create_converter_with_invalid_directories() -> None:
@@ -76,22 +86,38 @@ def test_latex_compiler_not_found():
             LaTeXCompiler()
 
 
-def test_main_function_error_handling():
+@pytest.fixture
+def main_patches() -> Generator[SimpleNamespace, None, None]:
+    """Patch main()'s collaborators, with the parser returning default options."""
+    args = argparse.Namespace(
+        quiet=False,
+        force=False,
+        tikz_dir=None,
+        output_dir=None,
+        jobs=None,
+        preamble=None,
+    )
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch("argparse.ArgumentParser.parse_args", return_value=args)
+        )
+        yield SimpleNamespace(
+            args=args,
+            create=stack.enter_context(patch("tikz2png.converter.create_converter")),
+            exit=stack.enter_context(patch("sys.exit")),
+            print=stack.enter_context(patch("rich.console.Console.print")),
+        )
+
+
+def test_main_function_error_handling(main_patches: SimpleNamespace) -> None:
     """Test main function error handling."""
-    mock_args: Mock = Mock(spec=Any)
-    mock_args.quiet = True
-    mock_args.force = False
-    mock_args.tikz_dir = "/nonexistent"
-    mock_args.output_dir = "/nonexistent"
+    main_patches.args.quiet = True
+    main_patches.args.tikz_dir = "/nonexistent"
+    main_patches.args.output_dir = "/nonexistent"
+    main_patches.create.side_effect = create_converter
 
-    with (
-        patch(
-            "argparse.ArgumentParser.parse_args", return_value=mock_args, autospec=True
-        ),
-        patch("sys.exit", autospec=True) as mock_exit,
-    ):
-        main()
-        mock_exit.assert_called_once_with(1)
+    main()
+    main_patches.exit.assert_called_once_with(1)
 
 
 def test_imagemagick_command_selection():
@@ -120,13 +146,13 @@ def test_imagemagick_command_selection():
             mock_warning.assert_called_once()
 
 
-def test_file_manager_needs_update(tmp_path: Path) -> None:
+def test_file_manager_needs_update(fake_dir: Path) -> None:
     """Test FileManager.needs_update with different scenarios."""
 
     manager = FileManager()
 
-    tex_file = tmp_path / "test.tex"
-    png_file = tmp_path / "test.png"
+    tex_file = fake_dir / "test.tex"
+    png_file = fake_dir / "test.png"
 
     # When PNG doesn't exist
     tex_file.touch()
@@ -134,31 +160,27 @@ def test_file_manager_needs_update(tmp_path: Path) -> None:
 
     # When TEX is newer
     png_file.touch()
-    time.sleep(1)
-    tex_file.touch()  # Updates timestamp to newer
+    os.utime(png_file, (1_700_000_000, 1_700_000_000))
+    os.utime(tex_file, (1_700_000_001, 1_700_000_001))
     assert manager.needs_update(tex_file, png_file)
 
     # When PNG is newer
-    tex_file.touch()
-    time.sleep(1)
-    png_file.touch()  # Makes PNG newer than TEX
+    os.utime(png_file, (1_700_000_002, 1_700_000_002))
     assert not manager.needs_update(tex_file, png_file)
 
 
-def test_file_manager_cleanup(tmp_path: Path) -> None:
+def test_file_manager_cleanup(fake_dir: Path) -> None:
     """Test FileManager.cleanup_auxiliary_files."""
     manager = FileManager()
-    base_path = tmp_path / "test.tex"
+    base_path = fake_dir / "test.tex"
 
-    # Create aux files
-    aux_files = [".aux", ".log", ".pdf"]
-    for ext in aux_files:
-        (tmp_path / f"test{ext}").touch()
+    (fake_dir / "test.pdf").touch()
+    (fake_dir / "test.aux").touch()
 
     manager.cleanup_auxiliary_files(base_path)
 
-    for ext in aux_files:
-        assert not (tmp_path / f"test{ext}").exists()
+    assert not (fake_dir / "test.pdf").exists()
+    assert (fake_dir / "test.aux").exists()
 
 
 def test_image_converter_magick_command(tmp_path: Path) -> None:
@@ -171,7 +193,7 @@ def test_image_converter_magick_command(tmp_path: Path) -> None:
         return "convert" if x == "convert" else None
 
     with patch("platform.system", return_value="Linux"):
-        with patch("shutil.which", new=create_autospec(check_magick)):
+        with patch("shutil.which", side_effect=check_magick):
             converter = ImageConverter()
             assert converter.command == "magick"
         # Fallback
@@ -180,9 +202,10 @@ def test_image_converter_magick_command(tmp_path: Path) -> None:
             assert converter.command == "convert"
 
 
-def test_image_converter_conversion_error(tmp_path: Path) -> None:
+def test_image_converter_conversion_error(
+    tmp_path: Path, image_converter: ImageConverter
+) -> None:
     """Test ImageConverter handling of conversion errors."""
-    converter = ImageConverter()
     pdf_file = tmp_path / "test.pdf"
     png_file = tmp_path / "test.png"
     pdf_file.touch()
@@ -190,39 +213,142 @@ def test_image_converter_conversion_error(tmp_path: Path) -> None:
     error = subprocess.CalledProcessError(1, cmd=[], stderr="error")
     with patch("subprocess.run", side_effect=error):
         with pytest.raises(ImageMagickError, match="Image conversion failed"):
-            converter.convert_pdf_to_png(pdf_file, png_file)
+            image_converter.convert_pdf_to_png(pdf_file, png_file)
+
+
+@pytest.fixture
+def scaffold_factory(
+    tmp_path: Path, mocks: SimpleNamespace
+) -> Callable[..., SimpleNamespace]:
+    """Build a TikZConverter over the named TeX files with mocked collaborators."""
+
+    def build(
+        tex_names: Sequence[str] = ("test.tex",), jobs: Optional[int] = None
+    ) -> SimpleNamespace:
+        tikz_dir = tmp_path / "tikz"
+        tikz_dir.mkdir()
+        tex_files = [tikz_dir / name for name in tex_names]
+        for tex_file in tex_files:
+            tex_file.touch()
+
+        directories = Mock()
+        directories.tikz = tikz_dir
+        directories.figures = tmp_path
+
+        converter = TikZConverter(
+            directories=directories,
+            image_converter=mocks.image_converter,
+            latex_compiler=mocks.latex_compiler,
+            file_manager=mocks.file_manager,
+            jobs=jobs,
+        )
+        return SimpleNamespace(
+            tex_file=tex_files[0], converter=converter, **vars(mocks)
+        )
 
+    return build
 
-def test_tikz_converter_process_file(tmp_path: Path) -> None:
-    """Test TikZConverter.process_file with mocked components."""
-    directories = Mock()
-    directories.figures = tmp_path
 
-    image_converter = create_autospec(ImageConverterInterface)
-    latex_compiler = create_autospec(LaTeXCompilerInterface)
-    file_manager = create_autospec(FileManagerInterface)
+@pytest.fixture
+def converter_scaffold(
+    scaffold_factory: Callable[..., SimpleNamespace],
+) -> SimpleNamespace:
+    """Build a TikZConverter over one TeX file with mocked collaborators."""
+    return scaffold_factory()
 
-    file_manager.needs_update = Mock(return_value=True)
-    latex_compiler.compile = Mock()
 
-    converter = TikZConverter(
-        directories=directories,
-        image_converter=image_converter,
-        latex_compiler=latex_compiler,
-        file_manager=file_manager,
+def _apply_behavior(scaffold: SimpleNamespace, behavior: str) -> None:
+    scaffold.file_manager.needs_update.return_value = behavior != "skip"
+    if behavior == "latex_error":
+        scaffold.latex_compiler.compile.side_effect = LaTeXError("Test error")
+    elif behavior == "image_error":
+        scaffold.image_converter.convert_pdf_to_png.side_effect = ImageMagickError(
+            "Test error"
+        )
+
+
+BEHAVIORS = [
+    ("success", {"processed": 1, "skipped": 0, "failed": 0}),
+    ("latex_error", {"processed": 0, "skipped": 0, "failed": 1}),
+    ("image_error", {"processed": 0, "skipped": 0, "failed": 1}),
+    ("skip", {"processed": 0, "skipped": 1, "failed": 0}),
+]
+
+SUCCESS_MESSAGE = "\n✅ [green]Successfully converted:[/] test.tex -> test.png"
+ERROR_MESSAGE = "[red]Error processing test.tex: Test error[/]"
+
+
+@pytest.mark.parametrize("with_progress", [False, True])
+@pytest.mark.parametrize("behavior, expected_stats", BEHAVIORS)
+def test_tikz_converter_process_file(
+    converter_scaffold: SimpleNamespace,
+    behavior: str,
+    expected_stats: Dict[str, int],
+    with_progress: bool,
+) -> None:
+    """Test TikZConverter.process_file outcomes, with and without a progress bar."""
+    scaffold = converter_scaffold
+    _apply_behavior(scaffold, behavior)
+    progress = Mock() if with_progress else None
+    task_id = TaskID(1) if with_progress else None
+
+    result = scaffold.converter.process_file(
+        scaffold.tex_file, task_id=task_id, progress=progress
     )
 
-    tex_file = tmp_path / "test.tex"
-    tex_file.touch()
+    assert result is (behavior == "success")
+    assert scaffold.converter.stats == expected_stats
+    if behavior == "skip":
+        scaffold.latex_compiler.compile.assert_not_called()
+    else:
+        scaffold.latex_compiler.compile.assert_called_once()
+    if behavior == "image_error":
+        scaffold.image_converter.convert_pdf_to_png.assert_called_once()
+
+    if progress is not None:
+        if behavior == "skip":
+            progress.update.assert_not_called()
+            progress.console.print.assert_not_called()
+        else:
+            progress.update.assert_called_once_with(
+                task_id, description="Processing test.tex"
+            )
+            progress.console.print.assert_called_once_with(
+                SUCCESS_MESSAGE if behavior == "success" else ERROR_MESSAGE
+            )
+
+
+def test_tikz_converter_success_message_needs_terminal(
+    converter_scaffold: SimpleNamespace,
+) -> None:
+    """Test that the per-file success line is dropped when output is piped."""
+    scaffold = converter_scaffold
+    _apply_behavior(scaffold, "success")
+    progress = Mock()
+    progress.console.is_terminal = False
+
+    assert scaffold.converter.process_file(
+        scaffold.tex_file, task_id=TaskID(1), progress=progress
+    )
+    progress.console.print.assert_not_called()
+
 
-    # Successful conversion
-    assert converter.process_file(tex_file, force=True)
-    assert converter.stats["processed"] == 1
+@pytest.mark.parametrize("behavior, expected_stats", BEHAVIORS)
+def test_tikz_converter_run(
+    converter_scaffold: SimpleNamespace,
+    behavior: str,
+    expected_stats: Dict[str, int],
+) -> None:
+    """Test TikZConverter.run outcomes for a single TeX file."""
+    scaffold = converter_scaffold
+    _apply_behavior(scaffold, behavior)
 
-    # Failed conversion
-    latex_compiler.compile = Mock(side_effect=LaTeXError("Test error"))
-    assert not converter.process_file(tex_file, force=True)
-    assert converter.stats["failed"] == 1
+    with patch("rich.console.Console.print") as mock_print:
+        scaffold.converter.run()
+        assert mock_print.call_count >= 2  # Initial panel and summary panel
+        if behavior.endswith("_error"):
+            mock_print.assert_any_call(ERROR_MESSAGE)
+    assert scaffold.converter.stats == expected_stats
 
 
 def test_tikz_converter_run_empty_directory(tmp_path: Path) -> None:
@@ -243,151 +369,26 @@ def test_tikz_converter_run_empty_directory(tmp_path: Path) -> None:
         mock_warning.assert_called_once_with("No .tex files found in Assets/TikZ!")
 
 
-def test_tikz_converter_run_with_files(tmp_path: Path) -> None:
-    """Test TikZConverter.run with tex files."""
-    tikz_dir = tmp_path / "tikz"
-    tikz_dir.mkdir()
-    tex_file = tikz_dir / "test.tex"
-    tex_file.touch()
-
-    directories = Mock()
-    directories.tikz = tikz_dir
-    directories.figures = tmp_path
-
-    image_converter = create_autospec(ImageConverterInterface)
-    latex_compiler = create_autospec(LaTeXCompilerInterface)
-    file_manager = create_autospec(FileManagerInterface)
-    file_manager.needs_update.return_value = True
-
-    converter = TikZConverter(
-        directories=directories,
-        image_converter=image_converter,
-        latex_compiler=latex_compiler,
-        file_manager=file_manager,
-    )
-
-    with patch("rich.console.Console.print") as mock_print:
-        converter.run()
-        assert mock_print.call_count >= 2  # Initial panel and summary panel
-        latex_compiler.compile.assert_called_once()
-
-
 def test_file_manager_cleanup_error(tmp_path: Path) -> None:
     """Test FileManager cleanup when permission error occurs."""
     manager = FileManager()
     base_path = tmp_path / "test.tex"
 
-    # Create a file and make the parent directory read-only
-    aux_file = tmp_path / "test.aux"
-    aux_file.touch()
-    tmp_path.chmod(0o555)  # Read and execute only, no write permission
-
-    with patch("rich.console.Console.print") as mock_print:
+    with (
+        patch.object(Path, "unlink", side_effect=PermissionError("denied")),
+        patch("rich.console.Console.print") as mock_print,
+    ):
         manager.cleanup_auxiliary_files(base_path)
-        mock_print.assert_called()
-        args, _ = mock_print.call_args
-        expected_start = f"\n⚠️  [yellow]Failed to remove[/] {aux_file.name}:"
-        assert args[0].startswith(expected_start)
-
-    # restore write permissions to allow pytest to clean up
-    tmp_path.chmod(0o755)
-
-
-def test_tikz_converter_with_progress(tmp_path: Path) -> None:
-    """Test TikZConverter with progress bar."""
-    tikz_dir = tmp_path / "tikz"
-    tikz_dir.mkdir()
-    tex_file = tikz_dir / "test.tex"
-    tex_file.touch()
-
-    directories = Mock()
-    directories.tikz = tikz_dir
-    directories.figures = tmp_path
-
-    image_converter = create_autospec(ImageConverterInterface)
-    latex_compiler = create_autospec(LaTeXCompilerInterface)
-    file_manager = create_autospec(FileManagerInterface)
-
-    converter = TikZConverter(
-        directories=directories,
-        image_converter=image_converter,
-        latex_compiler=latex_compiler,
-        file_manager=file_manager,
-    )
-
-    mock_progress = Mock()
-    mock_console = Mock()
-    mock_progress.console = mock_console
-    task_id = TaskID(1)
-
-    result = converter.process_file(
-        tex_file, force=True, task_id=task_id, progress=mock_progress
-    )
-    assert result is True
-
-    mock_progress.update.assert_called_with(
-        task_id, description=f"Processing {tex_file.name}"
-    )
-    mock_console.print.assert_called_with(
-        f"\n✅ [green]Successfully converted:[/] {tex_file.name} -> "
-        f"{tex_file.stem}.png"
-    )
-
-    expected_calls: list[Any] = [
-        call(
-            f"\n✅ [green]Successfully converted:[/] {tex_file.name} -> "
-            f"{tex_file.stem}.png"
-        ),
-    ]
-    mock_console.print.assert_has_calls(expected_calls, any_order=False)
-
-
-def test_tikz_converter_error_with_progress(tmp_path: Path) -> None:
-    """Test TikZConverter error handling with progress bar."""
-    tikz_dir = tmp_path / "tikz"
-    tikz_dir.mkdir()
-    tex_file = tikz_dir / "test.tex"
-    tex_file.touch()
-
-    directories = Mock()
-    directories.tikz = tikz_dir
-    directories.figures = tmp_path
-
-    image_converter = create_autospec(ImageConverterInterface)
-    latex_compiler = create_autospec(LaTeXCompilerInterface)
-    file_manager = create_autospec(FileManagerInterface)
-
-    latex_compiler.compile.side_effect = LaTeXError("Test error")
-
-    converter = TikZConverter(
-        directories=directories,
-        image_converter=image_converter,
-        latex_compiler=latex_compiler,
-        file_manager=file_manager,
-    )
-
-    mock_progress = Mock()
-    mock_console = Mock()
-    mock_progress.console = mock_console
-    task_id = TaskID(1)
-
-    result = converter.process_file(
-        tex_file, force=True, task_id=task_id, progress=mock_progress
-    )
-    assert not result
-    mock_console.print.assert_called_with(
-        "[red]Error processing " + tex_file.name + ": Test error[/]"
-    )
+        mock_print.assert_any_call("\n⚠️  [yellow]Failed to remove[/] test.pdf: denied")
 
 
-def test_latex_compiler_file_not_found() -> None:
+def test_latex_compiler_file_not_found(latex_compiler: LaTeXCompiler) -> None:
     """Test LaTeXCompiler when input file doesn't exist."""
-    compiler = LaTeXCompiler()
     with pytest.raises(FileNotFoundError, match="LaTeX file not found"):
-        compiler.compile(Path("nonexistent.tex"))
+        latex_compiler.compile(Path("nonexistent.tex"))
 
 
-def test_create_converter_with_quiet_mode() -> None:
+def test_create_converter_with_quiet_mode(tmp_path: Path) -> None:
     """Test create_converter with quiet mode enabled."""
     config = Config(
         quiet=True,
@@ -396,8 +397,12 @@ def test_create_converter_with_quiet_mode() -> None:
         output_dir=None,
     )
 
-    with patch("tikz2png.directories.Directories.create") as mock_create:
+    with (
+        patch("shutil.which", return_value="/usr/bin/tool"),
+        patch("tikz2png.directories.Directories.create") as mock_create,
+    ):
         mock_create.return_value = Mock()
+        mock_create.return_value.figures = tmp_path
         mock_create.return_value.validate = Mock()
 
         converter = create_converter(config)
@@ -405,54 +410,11 @@ def test_create_converter_with_quiet_mode() -> None:
         mock_create.assert_called_once()
 
 
-def test_tikz_converter_run_with_exception(tmp_path: Path) -> None:
-    """Test TikZConverter.run handles exceptions during processing."""
-    tikz_dir = tmp_path / "tikz"
-    tikz_dir.mkdir()
-    tex_file = tikz_dir / "test.tex"
-    tex_file.touch()
-
-    directories = Mock()
-    directories.tikz = tikz_dir
-    directories.figures = tmp_path
-
-    image_converter = create_autospec(ImageConverterInterface)
-    latex_compiler = create_autospec(LaTeXCompilerInterface)
-    file_manager = create_autospec(FileManagerInterface)
-
-    latex_compiler.compile.side_effect = LaTeXError("Compilation failed")
-
-    converter = TikZConverter(
-        directories=directories,
-        image_converter=image_converter,
-        latex_compiler=latex_compiler,
-        file_manager=file_manager,
-    )
-
-    with patch("rich.console.Console.print") as mock_print:
-        converter.run()
-        mock_print.assert_any_call(
-            "[red]Error processing test.tex: Compilation failed[/]"
-        )
-        assert converter.stats["failed"] == 1
-
-
-def test_tikz_converter_run_with_partial_failures(tmp_path: Path) -> None:
+def test_tikz_converter_run_with_partial_failures(
+    scaffold_factory: Callable[..., SimpleNamespace],
+) -> None:
     """Test TikZConverter.run with some files failing to process."""
-    tikz_dir = tmp_path / "tikz"
-    tikz_dir.mkdir()
-    tex_file1 = tikz_dir / "test1.tex"
-    tex_file2 = tikz_dir / "test2.tex"
-    tex_file1.touch()
-    tex_file2.touch()
-
-    directories = Mock()
-    directories.tikz = tikz_dir
-    directories.figures = tmp_path
-
-    image_converter = create_autospec(ImageConverterInterface)
-    latex_compiler = create_autospec(LaTeXCompilerInterface)
-    file_manager = create_autospec(FileManagerInterface)
+    scaffold = scaffold_factory(["test1.tex", "test2.tex"])
 
     # First file processes successfully, second fails
     def compile_side_effect(tex_file: Path) -> None:
@@ -461,14 +423,8 @@ def test_tikz_converter_run_with_partial_failures(tmp_path: Path) -> None:
         else:
             raise LaTeXError("Compilation failed for test2.tex")
 
-    latex_compiler.compile.side_effect = compile_side_effect
-
-    converter = TikZConverter(
-        directories=directories,
-        image_converter=image_converter,
-        latex_compiler=latex_compiler,
-        file_manager=file_manager,
-    )
+    scaffold.latex_compiler.compile.side_effect = compile_side_effect
+    converter = scaffold.converter
 
     with patch("rich.console.Console.print") as mock_print:
         converter.run()
@@ -480,105 +436,112 @@ def test_tikz_converter_run_with_partial_failures(tmp_path: Path) -> None:
         assert converter.stats["failed"] == 1
 
 
-def test_converter_main_with_validation_error() -> None:
+def test_converter_main_with_validation_error(main_patches: SimpleNamespace) -> None:
     """Test main function when directory validation fails."""
-    mock_args = Mock()
-    mock_args.quiet = False
-    mock_args.force = False
-    mock_args.tikz_dir = None
-    mock_args.output_dir = None
-
-    with (
-        patch("argparse.ArgumentParser.parse_args", return_value=mock_args),
-        patch("tikz2png.converter.create_converter") as mock_create,
-        patch("sys.exit") as mock_exit,
-        patch("rich.console.Console.print") as mock_print,
-    ):
-        mock_create.side_effect = PermissionError("Cannot write to figures directory")
-        main()
-        mock_print.assert_called_with(
-            "[red bold]❌ Error:[/] Cannot write to figures directory"
-        )
-        mock_exit.assert_called_once_with(1)
+    main_patches.create.side_effect = PermissionError(
+        "Cannot write to figures directory"
+    )
+    main()
+    main_patches.print.assert_called_with(
+        "[red bold]❌ Error:[/] Cannot write to figures directory"
+    )
+    main_patches.exit.assert_called_once_with(1)
 
 
-def test_converter_with_logger_setup() -> None:
+def test_converter_with_logger_setup(main_patches: SimpleNamespace) -> None:
     """Test logger setup in quiet mode."""
-    mock_args = Mock()
-    mock_args.quiet = True
-    mock_args.force = False
-    mock_args.tikz_dir = None
-    mock_args.output_dir = None
+    main_patches.args.quiet = True
+    main_patches.create.side_effect = Exception
 
-    with (
-        patch("argparse.ArgumentParser.parse_args", return_value=mock_args),
-        patch("logging.getLogger") as mock_logger,
-        patch("tikz2png.converter.create_converter", side_effect=Exception),
-        patch("sys.exit"),
-    ):
+    with patch("logging.getLogger") as mock_logger:
         main()
         mock_logger.return_value.setLevel.assert_called_once_with(logging.WARNING)
 
 
-def test_tikz_converter_with_skipped_files(tmp_path: Path) -> None:
-    """Test TikZConverter when files don't need updating."""
-    tikz_dir = tmp_path / "tikz"
-    tikz_dir.mkdir()
-    tex_file = tikz_dir / "test.tex"
-    tex_file.touch()
+def test_tikz_converter_run_respects_jobs(
+    scaffold_factory: Callable[..., SimpleNamespace],
+) -> None:
+    """Test TikZConverter.run caps the worker pool at the configured job count."""
+    scaffold = scaffold_factory(["a.tex", "b.tex", "c.tex"], jobs=2)
+    scaffold.file_manager.needs_update.return_value = True
+    converter = scaffold.converter
 
-    directories = Mock()
-    directories.tikz = tikz_dir
-    directories.figures = tmp_path
+    with (
+        patch(
+            "tikz2png.converter.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as mock_executor,
+        patch("rich.console.Console.print"),
+    ):
+        converter.run()
+        mock_executor.assert_called_once_with(max_workers=2)
+        assert converter.stats["processed"] == 3
 
-    image_converter = create_autospec(ImageConverterInterface)
-    latex_compiler = create_autospec(LaTeXCompilerInterface)
-    file_manager = create_autospec(FileManagerInterface)
-    file_manager.needs_update.return_value = False
 
-    converter = TikZConverter(
-        directories=directories,
-        image_converter=image_converter,
-        latex_compiler=latex_compiler,
-        file_manager=file_manager,
-    )
+def test_tikz_converter_run_settles_skips_before_dispatch(
+    converter_scaffold: SimpleNamespace,
+) -> None:
+    """Test that up-to-date files are skipped without going through a worker."""
+    converter_scaffold.file_manager.needs_update.return_value = False
+    converter = converter_scaffold.converter
 
-    result = converter.process_file(tex_file)
-    assert not result
-    assert converter.stats["skipped"] == 1
-    assert converter.stats["processed"] == 0
-    latex_compiler.compile.assert_not_called()
+    with (
+        patch.object(converter, "process_file") as mock_process,
+        patch("rich.console.Console.print"),
+    ):
+        converter.run()
+        mock_process.assert_not_called()
+        assert converter.stats["skipped"] == 1
 
 
-def test_tikz_converter_image_conversion_error(tmp_path: Path) -> None:
-    """Test TikZConverter when image conversion fails."""
-    tikz_dir = tmp_path / "tikz"
-    tikz_dir.mkdir()
-    tex_file = tikz_dir / "test.tex"
-    tex_file.touch()
+def test_tikz_converter_run_cancels_queued_files_on_interrupt(
+    scaffold_factory: Callable[..., SimpleNamespace],
+) -> None:
+    """Test that Ctrl-C drops queued files instead of compiling them all."""
+    scaffold = scaffold_factory([f"test{n}.tex" for n in range(10)], jobs=1)
 
-    directories = Mock()
-    directories.tikz = tikz_dir
-    directories.figures = tmp_path
+    started = threading.Event()
+    release = threading.Event()
+    finished = threading.Event()
 
-    image_converter = create_autospec(ImageConverterInterface)
-    latex_compiler = create_autospec(LaTeXCompilerInterface)
-    file_manager = create_autospec(FileManagerInterface)
-    file_manager.needs_update.return_value = True
+    def compile_first_blocks(tex_file: Path) -> None:
+        started.set()
+        release.wait(timeout=5)
 
-    image_converter.convert_pdf_to_png.side_effect = ImageMagickError(
-        "Conversion failed"
-    )
+    def interrupted(futures: object) -> None:
+        started.wait(timeout=5)
+        raise KeyboardInterrupt
 
-    converter = TikZConverter(
-        directories=directories,
-        image_converter=image_converter,
-        latex_compiler=latex_compiler,
-        file_manager=file_manager,
+    scaffold.file_manager.needs_update.return_value = True
+    scaffold.latex_compiler.compile.side_effect = compile_first_blocks
+    # Cleanup is the worker's last call into the shared mocks
+    scaffold.file_manager.cleanup_auxiliary_files.side_effect = lambda base_path: (
+        finished.set()
     )
 
-    result = converter.process_file(tex_file)
-    assert not result
-    assert converter.stats["failed"] == 1
-    latex_compiler.compile.assert_called_once()
-    image_converter.convert_pdf_to_png.assert_called_once()
+    converter = scaffold.converter
+
+    with (
+        patch("tikz2png.converter.as_completed", side_effect=interrupted),
+        patch("rich.console.Console.print"),
+        pytest.raises(KeyboardInterrupt),
+    ):
+        converter.run()
+    release.set()
+    # shutdown(wait=False) leaves the running file to finish in the background;
+    # wait for it so its calls cannot leak into tests sharing the mocks
+    assert finished.wait(timeout=5)
+    assert scaffold.latex_compiler.compile.call_count == 1
+
+
+def test_create_converter_force_resets_manifest(tmp_path: Path) -> None:
+    """Test that --force discards the recorded source hashes."""
+    manifest = tmp_path / MANIFEST_NAME
+    manifest.write_text('{"stem": "test", "hash": "abc"}\n')
+    config = Config(quiet=False, force=True, tikz_dir=tmp_path, output_dir=tmp_path)
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/tool"),
+        patch("rich.console.Console.print"),
+    ):
+        create_converter(config)
+    assert not manifest.exists()
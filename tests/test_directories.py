@@ -1,74 +1,59 @@
 from pathlib import Path
+from typing import Generator, Type
 
 import pytest
+from pyfakefs.fake_filesystem_unittest import Patcher
 
 from tikz2png.directories import Directories
 
 
-@pytest.fixture
-def temp_dir(tmp_path: Path) -> Path:
-    return tmp_path
-
-
-def test_directories_creation(temp_dir: Path) -> None:
-    directories = Directories.create(base_path=temp_dir)
+def test_directories_creation(fake_dir: Path) -> None:
+    directories = Directories.create(base_path=fake_dir)
     assert directories.tikz.exists()
     assert directories.figures.exists()
 
 
-def test_directories_validation(temp_dir: Path) -> None:
-    directories = Directories(tikz=temp_dir / "TikZ", figures=temp_dir / "figures")
+def test_directories_validation(fake_dir: Path) -> None:
+    directories = Directories(tikz=fake_dir / "TikZ", figures=fake_dir / "figures")
     directories.tikz.mkdir()
     directories.figures.mkdir()
     directories.validate()
 
 
-def test_directories_validation_failure(temp_dir: Path) -> None:
-    directories = Directories(
-        tikz=temp_dir / "nonexistent", figures=temp_dir / "figures"
-    )
-    with pytest.raises(FileNotFoundError):
-        directories.validate()
-
-
-def test_directories_validation_permission_error(temp_dir: Path) -> None:
-    """Test validation when directories have incorrect permissions."""
-    tikz_dir = temp_dir / "TikZ"
-    figures_dir = temp_dir / "figures"
-    tikz_dir.mkdir(mode=0o000)  # No permissions
-    figures_dir.mkdir()
-
-    directories = Directories(tikz=tikz_dir, figures=figures_dir)
-    with pytest.raises(PermissionError, match="Cannot read from TikZ directory"):
-        directories.validate()
-
-    # Cleanup
-    tikz_dir.chmod(0o755)
-
-
-def test_directories_validation_figures_permission_error(temp_dir: Path) -> None:
-    """Test validation when figures directory has incorrect permissions."""
-    tikz_dir = temp_dir / "TikZ"
-    figures_dir = temp_dir / "figures"
-    tikz_dir.mkdir()
-    figures_dir.mkdir(mode=0o444)  # Read-only
-
-    directories = Directories(tikz=tikz_dir, figures=figures_dir)
-    with pytest.raises(PermissionError, match="Cannot write to figures directory"):
-        directories.validate()
-
-    figures_dir.chmod(0o755)
+def _setup(base: Path, scenario: str) -> Directories:
+    """Create the TikZ and figures paths in the state a scenario describes."""
+    tikz_dir = base / "TikZ"
+    figures_dir = base / "figures"
+    if scenario == "tikz_is_file":
+        tikz_dir.touch()
+    elif scenario != "missing_tikz":
+        tikz_dir.mkdir(mode=0o000 if scenario == "tikz_no_read" else 0o755)
+    figures_dir.mkdir(mode=0o444 if scenario == "figures_no_write" else 0o755)
+    return Directories(tikz=tikz_dir, figures=figures_dir)
 
 
-def test_directories_validation_not_directory(temp_dir: Path) -> None:
-    """Test validation when path is not a directory."""
-    tikz_file = temp_dir / "TikZ"
-    figures_dir = temp_dir / "figures"
-    tikz_file.touch()
-    figures_dir.mkdir()
-
-    directories = Directories(tikz=tikz_file, figures=figures_dir)
-    with pytest.raises(NotADirectoryError, match="TikZ path is not a directory"):
+@pytest.fixture
+def unprivileged_dir() -> Generator[Path, None, None]:
+    """Fake directory seen as an unprivileged user, even when tests run as root."""
+    with Patcher(allow_root_user=False) as patcher:
+        yield Path(patcher.fs.create_dir("/work").path)
+
+
+@pytest.mark.parametrize(
+    "scenario, expected_exc, match",
+    [
+        ("missing_tikz", FileNotFoundError, "TikZ directory does not exist"),
+        ("tikz_no_read", PermissionError, "Cannot read from TikZ directory"),
+        ("figures_no_write", PermissionError, "Cannot write to figures directory"),
+        ("tikz_is_file", NotADirectoryError, "TikZ path is not a directory"),
+    ],
+)
+def test_directories_validation_errors(
+    unprivileged_dir: Path, scenario: str, expected_exc: Type[Exception], match: str
+) -> None:
+    """Test that validation reports each kind of unusable directory."""
+    directories = _setup(unprivileged_dir, scenario)
+    with pytest.raises(expected_exc, match=match):
         directories.validate()
 
 
@@ -81,9 +66,9 @@ def test_directories_create_with_invalid_paths() -> None:
         Directories.create(figures_path=Path("/nonexistent"))
 
 
-def test_directories_create_default_paths(tmp_path: Path) -> None:
+def test_directories_create_default_paths(fake_dir: Path) -> None:
     """Test Directories.create creates default paths."""
-    base = tmp_path / "project"
+    base = fake_dir / "project"
 
     # Should create Assets/TikZ and Assets/figures
     dirs = Directories.create(base_path=base)
@@ -1,18 +1,18 @@
-import time
+import os
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from rich.console import Console
 
-from tikz2png.converter import FileManager
+from tikz2png.converter import MANIFEST_NAME, FileManager, hash_tex, scan_mtimes
 
 
-def test_needs_update_when_png_missing(temp_dir: Path) -> None:
+def test_needs_update_when_png_missing(fake_dir: Path) -> None:
     """Test update detection when PNG file is missing."""
     mock_console = Mock(spec=Console)
     file_manager = FileManager(console=mock_console)
-    tex_file = temp_dir / "test.tex"
-    png_file = temp_dir / "test.png"
+    tex_file = fake_dir / "test.tex"
+    png_file = fake_dir / "test.png"
     tex_file.touch()
 
     result = file_manager.needs_update(tex_file, png_file)
@@ -20,28 +20,44 @@ def test_needs_update_when_png_missing(temp_dir: Path) -> None:
     mock_console.print.assert_called_once_with("🆕 [cyan]Will generate:[/] test.png")
 
 
-def test_needs_update_when_tex_newer(temp_dir: Path) -> None:
+def test_status_messages_suppressed_without_terminal(fake_dir: Path) -> None:
+    """Test that per-file status lines are not rendered when output is piped."""
+    mock_console = Mock(spec=Console)
+    mock_console.is_terminal = False
+    file_manager = FileManager(console=mock_console)
+    tex_file = fake_dir / "test.tex"
+    tex_file.touch()
+    (fake_dir / "test.pdf").touch()
+
+    assert file_manager.needs_update(tex_file, fake_dir / "test.png") is True
+    file_manager.cleanup_auxiliary_files(tex_file)
+    mock_console.print.assert_not_called()
+
+
+def test_needs_update_when_tex_newer(fake_dir: Path) -> None:
     """Test update detection when TeX file is newer than PNG."""
     mock_console = Mock(spec=Console)
     file_manager = FileManager(console=mock_console)
-    tex_file = temp_dir / "test.tex"
-    png_file = temp_dir / "test.png"
+    tex_file = fake_dir / "test.tex"
+    png_file = fake_dir / "test.png"
     png_file.touch()
-    time.sleep(0.1)
     tex_file.touch()
+    os.utime(png_file, (1_700_000_000, 1_700_000_000))
+    os.utime(tex_file, (1_700_000_001, 1_700_000_001))
 
     assert file_manager.needs_update(tex_file, png_file) is True
 
 
-def test_needs_update_when_png_up_to_date(temp_dir: Path) -> None:
+def test_needs_update_when_png_up_to_date(fake_dir: Path) -> None:
     """Test update detection when PNG file is current."""
     mock_console = Mock(spec=Console)
     file_manager = FileManager(console=mock_console)
-    tex_file = temp_dir / "test.tex"
-    png_file = temp_dir / "test.png"
+    tex_file = fake_dir / "test.tex"
+    png_file = fake_dir / "test.png"
     tex_file.touch()
-    time.sleep(0.1)
     png_file.touch()
+    os.utime(tex_file, (1_700_000_000, 1_700_000_000))
+    os.utime(png_file, (1_700_000_001, 1_700_000_001))
 
     result = file_manager.needs_update(tex_file, png_file)
     assert result is False
@@ -50,17 +66,169 @@ def test_needs_update_when_png_up_to_date(temp_dir: Path) -> None:
     )
 
 
-def test_cleanup_auxiliary_files(temp_dir: Path) -> None:
-    """Test removal of auxiliary files after compilation."""
+def test_cleanup_auxiliary_files(fake_dir: Path) -> None:
+    """Test that cleanup removes the intermediate PDF and leaves user files."""
     mock_console = Mock(spec=Console)
     file_manager = FileManager(console=mock_console)
-    base_path = temp_dir / "test"
-    aux_files = [base_path.with_suffix(ext) for ext in [".aux", ".log", ".pdf"]]
-    for file in aux_files:
+    base_path = fake_dir / "test.tex"
+    pdf_file = fake_dir / "test.pdf"
+    user_files = [fake_dir / "test.aux", fake_dir / "test.log"]
+    for file in [pdf_file, *user_files]:
         file.touch()
 
     file_manager.cleanup_auxiliary_files(base_path)
 
-    for file in aux_files:
-        assert not file.exists()
-    assert mock_console.print.call_count == len(aux_files)
+    assert not pdf_file.exists()
+    assert all(file.exists() for file in user_files)
+    mock_console.print.assert_called_once_with(
+        "\n🗑️  [dim]Removed auxiliary file:[/] test.pdf"
+    )
+
+
+def test_needs_update_with_mtime_snapshot(temp_dir: Path) -> None:
+    """Test update detection from scanned mtimes without touching the disk."""
+    mock_console = Mock(spec=Console)
+    file_manager = FileManager(console=mock_console)
+    tex_file = temp_dir / "test.tex"
+    png_file = temp_dir / "test.png"
+
+    with patch.object(Path, "stat") as mock_stat:
+        assert file_manager.needs_update(tex_file, png_file, {"test.tex": 1.0})
+        assert file_manager.needs_update(
+            tex_file, png_file, {"test.tex": 2.0, "test.png": 1.0}
+        )
+        assert not file_manager.needs_update(
+            tex_file, png_file, {"test.tex": 1.0, "test.png": 2.0}
+        )
+        mock_stat.assert_not_called()
+
+
+def test_scan_mtimes(fake_dir: Path) -> None:
+    """Test that scanning only collects files with the requested suffix."""
+    (fake_dir / "a.tex").touch()
+    (fake_dir / "b.png").touch()
+    (fake_dir / "c.tex").mkdir()
+
+    mtimes = scan_mtimes(fake_dir, ".tex")
+    assert list(mtimes) == ["a.tex"]
+    assert mtimes["a.tex"] == (fake_dir / "a.tex").stat().st_mtime
+
+
+def test_needs_update_skips_unchanged_content(temp_dir: Path) -> None:
+    """Test that a touched but unmodified TeX file does not trigger a rebuild."""
+    mock_console = Mock(spec=Console)
+    file_manager = FileManager(console=mock_console)
+    tex_file = temp_dir / "test.tex"
+    png_file = temp_dir / "test.png"
+    tex_file.write_text("\\begin{tikzpicture}\\end{tikzpicture}")
+    png_file.touch()
+    file_manager.mark_updated(tex_file, png_file)
+    os.utime(png_file, (1_700_000_000, 1_700_000_000))
+    os.utime(tex_file, (1_700_000_001, 1_700_000_001))
+
+    assert file_manager.needs_update(tex_file, png_file) is False
+    # The PNG is brought forward so the next run skips without rehashing
+    assert png_file.stat().st_mtime > 1_700_000_001
+
+    tex_file.write_text("\\begin{tikzpicture}\\draw;\\end{tikzpicture}")
+    os.utime(png_file, (1_700_000_000, 1_700_000_000))
+    os.utime(tex_file, (1_700_000_001, 1_700_000_001))
+    assert file_manager.needs_update(tex_file, png_file) is True
+
+
+def test_hash_tex_includes_inputs(temp_dir: Path) -> None:
+    """Test that files pulled in with \\input change the source hash."""
+    tex_file = temp_dir / "test.tex"
+    style_file = temp_dir / "style.tex"
+    tex_file.write_text("\\input{style}\\input{tikz-library}")
+    style_file.write_text("\\tikzset{a/.style={}}")
+
+    before = hash_tex(tex_file)
+    style_file.write_text("\\tikzset{b/.style={}}")
+    assert hash_tex(tex_file) != before
+
+
+def test_needs_update_when_input_changes(temp_dir: Path) -> None:
+    """Test that editing only an \\input file triggers a rebuild."""
+    mock_console = Mock(spec=Console)
+    manifest = temp_dir / MANIFEST_NAME
+    tex_file = temp_dir / "test.tex"
+    style_file = temp_dir / "style.tex"
+    png_file = temp_dir / "test.png"
+    tex_file.write_text("\\input{style}")
+    style_file.write_text("\\tikzset{a/.style={}}")
+    png_file.touch()
+    FileManager(console=mock_console, manifest=manifest).mark_updated(
+        tex_file, png_file
+    )
+    os.utime(tex_file, (1_700_000_000, 1_700_000_000))
+    os.utime(png_file, (1_700_000_001, 1_700_000_001))
+
+    style_file.write_text("\\tikzset{b/.style={}}")
+    os.utime(style_file, (1_700_000_002, 1_700_000_002))
+    file_manager = FileManager(console=mock_console, manifest=manifest)
+    assert file_manager.needs_update(tex_file, png_file) is True
+
+    style_file.unlink()
+    assert file_manager.needs_update(tex_file, png_file) is True
+
+
+def test_needs_update_with_absolute_input(temp_dir: Path) -> None:
+    """Test that an \\input outside the TikZ folder is tracked by its path."""
+    mock_console = Mock(spec=Console)
+    manifest = temp_dir / MANIFEST_NAME
+    tikz_dir = temp_dir / "tikz"
+    style_file = temp_dir / "styles" / "common.tex"
+    tikz_dir.mkdir()
+    style_file.parent.mkdir()
+    tex_file = tikz_dir / "abs.tex"
+    png_file = temp_dir / "abs.png"
+    tex_file.write_text(f"\\input{{{style_file.with_suffix('').as_posix()}}}")
+    style_file.write_text("\\tikzset{a/.style={}}")
+    png_file.touch()
+    FileManager(console=mock_console, manifest=manifest).mark_updated(
+        tex_file, png_file
+    )
+    os.utime(tex_file, (1_700_000_000, 1_700_000_000))
+    os.utime(png_file, (1_700_000_001, 1_700_000_001))
+
+    file_manager = FileManager(console=mock_console, manifest=manifest)
+    os.utime(style_file, (1_700_000_000, 1_700_000_000))
+    assert file_manager.needs_update(tex_file, png_file) is False
+    style_file.write_text("\\tikzset{b/.style={}}")
+    os.utime(style_file, (1_700_000_002, 1_700_000_002))
+    assert file_manager.needs_update(tex_file, png_file) is True
+
+
+def test_mark_updated_logs_errors(temp_dir: Path) -> None:
+    """Test that a manifest bookkeeping error does not fail the conversion."""
+    file_manager = FileManager(console=Mock(spec=Console))
+
+    with patch("tikz2png.converter.logger.warning") as mock_warning:
+        file_manager.mark_updated(temp_dir / "missing.tex", temp_dir / "missing.png")
+    mock_warning.assert_called_once()
+    assert "missing.tex" in mock_warning.call_args[0][0]
+
+
+def test_manifest_persists_hashes(temp_dir: Path) -> None:
+    """Test that recorded hashes survive into a new FileManager."""
+    mock_console = Mock(spec=Console)
+    manifest = temp_dir / MANIFEST_NAME
+    tex_file = temp_dir / "test.tex"
+    png_file = temp_dir / "test.png"
+    tex_file.write_text("\\draw (0,0) -- (1,1);")
+    png_file.touch()
+
+    first = FileManager(console=mock_console, manifest=manifest)
+    first.mark_updated(tex_file, png_file)
+    first.mark_updated(tex_file, png_file)
+    with manifest.open("a") as f:
+        f.write('{"stem": "trunc')
+    assert len(manifest.read_text().splitlines()) == 3
+
+    os.utime(png_file, (1_700_000_000, 1_700_000_000))
+    os.utime(tex_file, (1_700_000_001, 1_700_000_001))
+    second = FileManager(console=mock_console, manifest=manifest)
+    assert second.needs_update(tex_file, png_file) is False
+    # Superseded and malformed entries are compacted away on load
+    assert len(manifest.read_text().splitlines()) == 1
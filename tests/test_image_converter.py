@@ -1,10 +1,18 @@
+import shutil
+import subprocess
 from pathlib import Path
+from typing import List
 from unittest.mock import patch
 
 import pytest
 
-from tikz2png.converter import ImageConverter
-from tikz2png.errors import ImageMagickError
+from tikz2png.converter import (
+    GhostscriptConverter,
+    ImageConverter,
+    PdftocairoConverter,
+    create_image_converter,
+)
+from tikz2png.errors import ImageConversionError, ImageMagickError
 
 
 def test_image_converter_initialisation() -> None:
@@ -23,23 +31,233 @@ def test_image_converter_initialisation() -> None:
         assert converter.command == "convert"
 
 
-def test_convert_pdf_to_png_success(temp_dir: Path) -> None:
+def test_convert_pdf_to_png_success(
+    temp_dir: Path, image_converter: ImageConverter
+) -> None:
     """Test successful PDF to PNG conversion."""
     pdf_file = temp_dir / "test.pdf"
     png_file = temp_dir / "test.png"
     pdf_file.touch()  # An empty PDF file for testing
 
     with patch("subprocess.run") as mock_run:
-        converter = ImageConverter()
-        converter.convert_pdf_to_png(pdf_file, png_file)
+        image_converter.convert_pdf_to_png(pdf_file, png_file)
         mock_run.assert_called_once()
 
 
-def test_convert_pdf_to_png_failure(temp_dir: Path) -> None:
+def test_convert_pdf_to_png_failure(
+    temp_dir: Path, image_converter: ImageConverter
+) -> None:
     """Test proper error handling when PDF conversion fails."""
     pdf_file = temp_dir / "nonexistent.pdf"
     png_file = temp_dir / "test.png"
 
-    converter = ImageConverter()
-    with pytest.raises(ImageMagickError):
+    with pytest.raises(ImageMagickError, match="mocked"):
+        image_converter.convert_pdf_to_png(pdf_file, png_file)
+
+
+@pytest.mark.slow
+@pytest.mark.real_subprocess
+@pytest.mark.skipif(
+    not (shutil.which("magick") or shutil.which("convert")),
+    reason="ImageMagick not installed",
+)
+def test_convert_pdf_to_png_failure_with_imagemagick(temp_dir: Path) -> None:
+    """Test that a failing ImageMagick run is reported as an ImageMagickError."""
+    with pytest.raises(ImageMagickError, match="Image conversion failed"):
+        ImageConverter().convert_pdf_to_png(
+            temp_dir / "nonexistent.pdf", temp_dir / "test.png"
+        )
+
+
+def test_convert_pdf_to_png_thread_limit(temp_dir: Path) -> None:
+    """Test that the thread cap only applies while conversions overlap."""
+    pdf_file = temp_dir / "test.pdf"
+    png_file = temp_dir / "test.png"
+    converter = ImageConverter(threads=2, command="magick")
+    calls: List[List[str]] = []
+
+    def run(args: List[str], **kwargs: object) -> None:
+        calls.append(args)
+        if len(calls) == 1:
+            # A second conversion starts while the first is still running
+            converter.convert_pdf_to_png(pdf_file, png_file)
+
+    with patch("subprocess.run", side_effect=run):
+        converter.convert_pdf_to_png(pdf_file, png_file)
+        converter.convert_pdf_to_png(pdf_file, png_file)
+
+    assert "-limit" not in calls[0]
+    assert calls[1][1:4] == ["-limit", "thread", "2"]
+    assert "-limit" not in calls[2]
+
+
+def fake_pdftocairo(pages: int):
+    """Build a subprocess.run replacement emulating pdftocairo's page output."""
+
+    def run(args: List[str], **kwargs: object) -> subprocess.CompletedProcess:
+        width = len(str(pages))
+        for n in range(1, pages + 1):
+            Path(f"{args[-1]}-{n:0{width}d}.png").write_text(str(n))
+        return subprocess.CompletedProcess(args, 0)
+
+    return run
+
+
+@pytest.mark.parametrize(
+    ("pages", "expected"),
+    [(1, ["test.png"]), (12, [f"test-{n}.png" for n in range(12)])],
+    ids=["single-page", "multi-page"],
+)
+def test_pdftocairo_convert_pdf_to_png(
+    temp_dir: Path, pages: int, expected: List[str]
+) -> None:
+    """Test that pdftocairo writes every page under the expected names."""
+    pdf_file = temp_dir / "test.pdf"
+    png_file = temp_dir / "test.png"
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/pdftocairo"),
+        patch("subprocess.run", side_effect=fake_pdftocairo(pages)) as mock_run,
+    ):
+        converter = PdftocairoConverter()
         converter.convert_pdf_to_png(pdf_file, png_file)
+        args = mock_run.call_args[0][0]
+        assert args[0] == "pdftocairo"
+        assert "-singlefile" not in args
+    assert sorted(p.name for p in temp_dir.iterdir()) == sorted(expected)
+    # Zero-padded page numbers are renumbered in page order
+    assert (temp_dir / expected[-1]).read_text() == str(pages)
+
+
+def test_pdftocairo_not_found() -> None:
+    """Test pdftocairo detection when Poppler is not installed."""
+    with patch("shutil.which", return_value=None):
+        with pytest.raises(ImageConversionError, match="pdftocairo not found"):
+            PdftocairoConverter()
+
+
+def test_create_image_converter_prefers_pdftocairo() -> None:
+    """Test that pdftocairo is chosen when available, ImageMagick otherwise."""
+    with patch("shutil.which", return_value="/usr/bin/tool"):
+        assert isinstance(create_image_converter(), PdftocairoConverter)
+
+    with (
+        patch("platform.system", return_value="Linux"),
+        patch("shutil.which", side_effect=lambda cmd: cmd == "magick"),
+    ):
+        converter = create_image_converter(threads=2)
+        assert isinstance(converter, ImageConverter)
+        assert converter.threads == 2
+
+
+def test_create_image_converter_falls_back_to_ghostscript() -> None:
+    """Test that Ghostscript is chosen over ImageMagick without pdftocairo."""
+    with (
+        patch("platform.system", return_value="Linux"),
+        patch("shutil.which", side_effect=lambda cmd: cmd != "pdftocairo"),
+    ):
+        converter = create_image_converter(threads=2)
+        assert isinstance(converter, GhostscriptConverter)
+        assert converter.workers == 2
+
+
+def test_create_image_converter_none_installed() -> None:
+    """Test that the error names every supported converter."""
+    with patch("shutil.which", return_value=None):
+        with pytest.raises(ImageConversionError, match="Poppler, Ghostscript or"):
+            create_image_converter()
+
+
+def fake_ghostscript(pages: int):
+    """Build a subprocess.run replacement emulating gs page counting/rendering."""
+
+    def run(args: List[str], **kwargs: object) -> subprocess.CompletedProcess:
+        if "-dNODISPLAY" in args:
+            return subprocess.CompletedProcess(args, 0, stdout=f"{pages}\n")
+        options = dict(
+            arg[2:].split("=")
+            for arg in args
+            if arg.startswith(("-dFirstPage=", "-dLastPage="))
+        )
+        output = args[args.index("-o") + 1]
+        # Without a page range gs renders the whole document
+        first = int(options.get("FirstPage", 1))
+        last = int(options.get("LastPage", pages))
+        for n in range(1, last - first + 2):
+            Path(output.replace("%d", str(n))).touch()
+        return subprocess.CompletedProcess(args, 0, stdout="")
+
+    return run
+
+
+def test_ghostscript_single_page(temp_dir: Path) -> None:
+    """Test that a single-page PDF is rendered straight to the PNG path."""
+    png_file = temp_dir / "test.png"
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/gs"),
+        patch("subprocess.run", side_effect=fake_ghostscript(1)) as mock_run,
+    ):
+        GhostscriptConverter(workers=4).convert_pdf_to_png(
+            temp_dir / "test.pdf", png_file
+        )
+        assert mock_run.call_count == 2
+        assert png_file.exists()
+
+
+@pytest.mark.parametrize(
+    ("pages", "expected"),
+    [(1, ["test.png"]), (3, ["test-0.png", "test-1.png", "test-2.png"])],
+    ids=["single-page", "multi-page"],
+)
+def test_ghostscript_single_worker(
+    temp_dir: Path, pages: int, expected: List[str]
+) -> None:
+    """Test that one worker renders every page in a single gs call."""
+    png_file = temp_dir / "test.png"
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/gs"),
+        patch("subprocess.run", side_effect=fake_ghostscript(pages)) as mock_run,
+    ):
+        GhostscriptConverter(workers=1).convert_pdf_to_png(
+            temp_dir / "test.pdf", png_file
+        )
+        mock_run.assert_called_once()
+        assert "-dNODISPLAY" not in mock_run.call_args[0][0]
+
+    assert sorted(p.name for p in temp_dir.iterdir()) == expected
+
+
+def test_ghostscript_multi_page_parallel(temp_dir: Path) -> None:
+    """Test that page ranges are fanned out and renumbered like ImageMagick."""
+    png_file = temp_dir / "test.png"
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/gs"),
+        patch("subprocess.run", side_effect=fake_ghostscript(5)) as mock_run,
+    ):
+        GhostscriptConverter(workers=2).convert_pdf_to_png(
+            temp_dir / "test.pdf", png_file
+        )
+        assert mock_run.call_count == 3  # page count + one gs per range
+
+    assert sorted(p.name for p in temp_dir.iterdir()) == [
+        f"test-{n}.png" for n in range(5)
+    ]
+
+
+def test_ghostscript_not_found() -> None:
+    """Test Ghostscript detection when not installed."""
+    with patch("shutil.which", return_value=None):
+        with pytest.raises(ImageConversionError, match="Ghostscript not found"):
+            GhostscriptConverter()
+
+
+def test_image_converter_with_resolved_command() -> None:
+    """Test that an injected command skips the PATH lookup."""
+    with patch("shutil.which") as mock_which:
+        assert ImageConverter(command="magick").command == "magick"
+        assert PdftocairoConverter(command="pdftocairo").command == "pdftocairo"
+        assert GhostscriptConverter(command="gs").command == "gs"
+        mock_which.assert_not_called()
@@ -1,4 +1,9 @@
+import functools
+import re
+import shutil
+import subprocess
 from pathlib import Path
+from typing import List, Optional
 from unittest.mock import patch
 
 import pytest
@@ -7,6 +12,28 @@ from tikz2png.converter import LaTeXCompiler
 from tikz2png.errors import LaTeXError
 
 
+def fake_latex(
+    args: List[str], version: str = "pdfTeX 3.141592653", **kwargs: object
+) -> subprocess.CompletedProcess:
+    """Emulate pdflatex by writing the PDF and log into the output directory."""
+    if "--version" in args:
+        return subprocess.CompletedProcess(args, 0, stdout=f"{version}\n")
+    prefix = "-output-directory="
+    out_dir = Path(next(a for a in args if a.startswith(prefix))[len(prefix) :])
+    if "-ini" in args:
+        jobname = next(a for a in args if a.startswith("-jobname="))[len("-jobname=") :]
+        (out_dir / f"{jobname}.fmt").touch()
+        return subprocess.CompletedProcess(args, 0)
+    stem = Path(args[-1]).stem
+    # Like pdflatex, fail to open an \include's .aux in a missing folder
+    source = Path(str(kwargs["cwd"])) / args[-1]
+    for name in re.findall(r"\\include\{([^}]+)\}", source.read_text()):
+        (out_dir / f"{name}.aux").touch()
+    (out_dir / f"{stem}.pdf").touch()
+    (out_dir / f"{stem}.log").touch()
+    return subprocess.CompletedProcess(args, 0)
+
+
 def test_latex_compiler_initialisation() -> None:
     """Test that LaTeXCompiler initialises with the correct LaTeX command."""
     with patch("shutil.which", return_value="/usr/bin/pdflatex"):
@@ -14,24 +41,189 @@ def test_latex_compiler_initialisation() -> None:
         assert compiler.latex_command == "pdflatex"
 
 
-def test_compile_success(temp_dir: Path) -> None:
+def test_compile_with_include_in_subdirectory(
+    temp_dir: Path, latex_compiler: LaTeXCompiler
+) -> None:
+    """Test that folders of \\include'd files exist in the output directory."""
+    tex_file = temp_dir / "test.tex"
+    tex_file.write_text("\\include{chapters/intro}\\include{summary}")
+
+    with patch("subprocess.run", side_effect=fake_latex):
+        latex_compiler.compile(tex_file)
+    assert (temp_dir / "test.pdf").exists()
+
+
+def test_compile_success(temp_dir: Path, latex_compiler: LaTeXCompiler) -> None:
     """Test successful LaTeX document compilation."""
     tex_file = temp_dir / "test.tex"
-    tex_file.write_text("\\documentclass{article}\\begin{document}Hello\\end{document}")
+    tex_file.touch()
 
-    with patch("subprocess.run") as mock_run:
-        compiler = LaTeXCompiler()
-        compiler.compile(tex_file)
+    with patch("subprocess.run", side_effect=fake_latex) as mock_run:
+        latex_compiler.compile(tex_file)
         mock_run.assert_called_once()
+        assert mock_run.call_args[1]["stdout"] is subprocess.DEVNULL
+
+    # Only the PDF is moved next to the source; auxiliary files stay isolated
+    assert sorted(p.name for p in temp_dir.iterdir()) == ["test.pdf", "test.tex"]
+
+
+def test_compile_without_pdf(temp_dir: Path, latex_compiler: LaTeXCompiler) -> None:
+    """Test that a run producing no PDF is reported as a LaTeX error."""
+    tex_file = temp_dir / "test.tex"
+    tex_file.touch()
 
+    with patch("subprocess.run"):
+        with pytest.raises(LaTeXError, match="produced no PDF"):
+            latex_compiler.compile(tex_file)
 
-def test_compile_failure(temp_dir: Path) -> None:
+
+def test_compile_failure(temp_dir: Path, latex_compiler: LaTeXCompiler) -> None:
     """Test that compilation errors are properly handled and raised."""
     tex_file = temp_dir / "test.tex"
+    tex_file.touch()
+
+    with pytest.raises(LaTeXError, match="mocked"):
+        latex_compiler.compile(tex_file)
+
+
+def test_compile_failure_reports_log_errors(
+    temp_dir: Path, latex_compiler: LaTeXCompiler
+) -> None:
+    """Test that errors are read from the LaTeX log when stderr is empty."""
+    tex_file = temp_dir / "test.tex"
+    tex_file.touch()
+
+    def failing_latex(args: List[str], **kwargs: object) -> None:
+        out_dir = Path(args[-2][len("-output-directory=") :])
+        (out_dir / "test.log").write_bytes(
+            b"This is pdfTeX\n! Undefined control sequence.\nl.1 \\foo\n"
+        )
+        raise subprocess.CalledProcessError(1, args, stderr=b"")
+
+    with patch("subprocess.run", side_effect=failing_latex):
+        with pytest.raises(LaTeXError, match="! Undefined control sequence.$"):
+            latex_compiler.compile(tex_file)
+
+
+requires_pdflatex = pytest.mark.skipif(
+    shutil.which("pdflatex") is None, reason="pdflatex not installed"
+)
+
+
+@pytest.mark.slow
+@pytest.mark.real_subprocess
+@requires_pdflatex
+def test_compile_with_pdflatex(temp_dir: Path) -> None:
+    """Test compiling a document with the installed pdflatex."""
+    tex_file = temp_dir / "test.tex"
+    tex_file.write_text("\\documentclass{article}\\begin{document}Hello\\end{document}")
+
+    LaTeXCompiler().compile(tex_file)
+    assert (temp_dir / "test.pdf").exists()
+
+
+@pytest.mark.slow
+@pytest.mark.real_subprocess
+@requires_pdflatex
+def test_compile_failure_with_pdflatex(temp_dir: Path) -> None:
+    """Test that errors from the installed pdflatex are read from its log."""
+    tex_file = temp_dir / "test.tex"
     tex_file.write_text(
         "\\documentclass{article}\\begin{document}\\error\\end{document}"
     )
 
-    compiler = LaTeXCompiler()
-    with pytest.raises(LaTeXError):
+    with pytest.raises(LaTeXError, match="Undefined control sequence"):
+        LaTeXCompiler().compile(tex_file)
+
+
+def test_preamble_format_built_once(temp_dir: Path) -> None:
+    """Test that the preamble format is built on first use and then reused."""
+    preamble = temp_dir / "preamble.tex"
+    preamble.write_text("\\documentclass{standalone}\\usepackage{tikz}")
+    cache_dir = temp_dir / "cache"
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/pdflatex"),
+        patch("subprocess.run", side_effect=fake_latex) as mock_run,
+    ):
+        compiler = LaTeXCompiler(preamble=preamble, cache_dir=cache_dir)
+        args = mock_run.call_args[0][0]
+        assert "-ini" in args
+        assert args[-1] == "&pdflatex mylatexformat.ltx preamble.tex"
+        assert [p.name for p in cache_dir.iterdir()] == [f"{compiler.format_name}.fmt"]
+
+        mock_run.reset_mock()
+        LaTeXCompiler(preamble=preamble, cache_dir=cache_dir)
+        # Only the version banner is read to find the cached format
+        mock_run.assert_called_once()
+        assert "--version" in mock_run.call_args[0][0]
+
+
+def test_preamble_format_key(temp_dir: Path) -> None:
+    """Test that the format changes with the engine version and \\input files."""
+    preamble = temp_dir / "preamble.tex"
+    preamble.write_text("\\documentclass{standalone}\\input{macros}")
+    macros = temp_dir / "macros.tex"
+    macros.write_text("\\newcommand{\\a}{}")
+    cache_dir = temp_dir / "cache"
+
+    def build(version: str) -> Optional[str]:
+        with patch(
+            "subprocess.run", side_effect=functools.partial(fake_latex, version=version)
+        ):
+            return LaTeXCompiler(
+                preamble=preamble, cache_dir=cache_dir, command="pdflatex"
+            ).format_name
+
+    first = build("pdfTeX 3.141592653-2.6-1.40.25")
+    assert build("pdfTeX 3.141592653-2.6-1.40.26") != first
+    macros.write_text("\\newcommand{\\b}{}")
+    assert build("pdfTeX 3.141592653-2.6-1.40.25") != first
+
+
+def test_preamble_format_failure_not_cached(temp_dir: Path) -> None:
+    """Test that a format dumped by a failing run is discarded, not reused."""
+    preamble = temp_dir / "preamble.tex"
+    preamble.write_text("\\documentclass{standalone}\\foo")
+    cache_dir = temp_dir / "cache"
+
+    def failing_ini(args: List[str], **kwargs: object) -> object:
+        if "-ini" not in args:
+            return fake_latex(args, **kwargs)
+        fake_latex(args, **kwargs)  # nonstopmode dumps the format regardless
+        out_dir = Path(args[3][len("-output-directory=") :])
+        jobname = args[2][len("-jobname=") :]
+        (out_dir / f"{jobname}.log").write_bytes(b"! Undefined control sequence.\n")
+        raise subprocess.CalledProcessError(1, args, stderr=b"")
+
+    with patch("subprocess.run", side_effect=failing_ini):
+        with pytest.raises(LaTeXError, match="Undefined control sequence"):
+            LaTeXCompiler(preamble=preamble, cache_dir=cache_dir, command="pdflatex")
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_compile_with_preamble_format(temp_dir: Path) -> None:
+    """Test that documents are compiled against the cached format."""
+    preamble = temp_dir / "preamble.tex"
+    preamble.write_text("\\documentclass{standalone}\\usepackage{tikz}")
+    tex_file = temp_dir / "test.tex"
+    tex_file.touch()
+    cache_dir = temp_dir / "cache"
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/pdflatex"),
+        patch("subprocess.run", side_effect=fake_latex) as mock_run,
+    ):
+        compiler = LaTeXCompiler(preamble=preamble, cache_dir=cache_dir)
         compiler.compile(tex_file)
+        args = mock_run.call_args[0][0]
+        assert args[1] == f"-fmt={compiler.format_name}"
+        assert mock_run.call_args[1]["env"]["TEXFORMATS"].startswith(str(cache_dir))
+
+
+def test_latex_compiler_with_resolved_command() -> None:
+    """Test that an injected command skips the PATH lookup."""
+    with patch("shutil.which") as mock_which:
+        compiler = LaTeXCompiler(command="/opt/texlive/bin/pdflatex")
+        assert compiler.latex_command == "/opt/texlive/bin/pdflatex"
+        mock_which.assert_not_called()
@@ -16,9 +16,7 @@ def test_tikz_converter_run(temp_dir: Path) -> None:
     directories.tikz.mkdir()
     directories.figures.mkdir()
     tex_file = directories.tikz / "test.tex"
-    tex_file.write_text(
-        "\\documentclass{standalone}\\begin{document}Test\\end{document}"
-    )
+    tex_file.touch()
 
     with (
         patch("tikz2png.converter.ImageConverter") as mock_image_converter,